@@ -1,17 +1,49 @@
-"""SkillBench-PD benchmark utilities."""
-
-from .harness import load_config, run_benchmark, validate_config
-from .experiment import ExperimentOptions, run_experiment
-from .report import (
-    generate_reports,
-    aggregate_by_mode,
-    aggregate_by_task_mode,
-    compute_mode_deltas,
-    compute_task_deltas,
-    create_task_charts,
-)
-from .regression import RegressionThresholds, build_regression_report, write_regression_report
-from .providers import ProviderFactory, ProviderResult
+"""SkillBench-PD benchmark utilities.
+
+Public names are resolved lazily (PEP 562) so that importing a single
+submodule, e.g. ``bench.cli`` for ``--help``, does not pull in matplotlib,
+the regression engine, or provider SDKs up front.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .experiment import ExperimentOptions, run_experiment
+    from .harness import load_config, run_benchmark, validate_config
+    from .providers import ProviderFactory, ProviderResult
+    from .regression import RegressionThresholds, build_regression_report, write_regression_report
+    from .report import (
+        aggregate_all,
+        aggregate_by_mode,
+        aggregate_by_task_mode,
+        compute_mode_deltas,
+        compute_task_deltas,
+        create_task_charts,
+        generate_reports,
+    )
+
+_LAZY = {
+    "load_config": "bench.harness",
+    "run_benchmark": "bench.harness",
+    "validate_config": "bench.harness",
+    "ExperimentOptions": "bench.experiment",
+    "run_experiment": "bench.experiment",
+    "generate_reports": "bench.report",
+    "aggregate_all": "bench.report",
+    "aggregate_by_mode": "bench.report",
+    "aggregate_by_task_mode": "bench.report",
+    "compute_mode_deltas": "bench.report",
+    "compute_task_deltas": "bench.report",
+    "create_task_charts": "bench.report",
+    "RegressionThresholds": "bench.regression",
+    "build_regression_report": "bench.regression",
+    "write_regression_report": "bench.regression",
+    "ProviderFactory": "bench.providers",
+    "ProviderResult": "bench.providers",
+}
 
 __all__ = [
     "load_config",
@@ -20,8 +52,7 @@ __all__ = [
     "ExperimentOptions",
     "run_experiment",
     "generate_reports",
-    "ProviderFactory",
-    "ProviderResult",
+    "aggregate_all",
     "aggregate_by_mode",
     "aggregate_by_task_mode",
     "compute_mode_deltas",
@@ -30,4 +61,19 @@ __all__ = [
     "RegressionThresholds",
     "build_regression_report",
     "write_regression_report",
+    "ProviderFactory",
+    "ProviderResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,75 @@
+"""Opt-in on-disk cache of provider responses, keyed by model and prompt.
+
+Enabled with ``SKILLBENCH_CACHE=1``, which also turns on the parsed-config cache
+in ``bench.harness``. Cached hits report ``latency_ms=0.0``, so
+leave the cache off for runs whose latency numbers feed a regression gate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+from .providers import ProviderResult
+
+CACHE_ENV = "SKILLBENCH_CACHE"
+CACHE_DIR_ENV = "SKILLBENCH_CACHE_DIR"
+DEFAULT_CACHE_DIR = ".bench_cache"
+
+
+def enabled() -> bool:
+    return os.getenv(CACHE_ENV, "") == "1"
+
+
+def cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}|{prompt}".encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> ProviderResult | None:
+    try:
+        data = json.loads(_entry_path(key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    return ProviderResult(
+        output=data["output"],
+        tokens_in=data.get("tokens_in"),
+        tokens_out=data.get("tokens_out"),
+        latency_ms=0.0,
+        tokens_cached=data.get("tokens_cached"),
+    )
+
+
+def put(key: str, result: ProviderResult) -> None:
+    try:
+        write_atomic(_entry_path(key), json.dumps(asdict(result)))
+    except OSError:
+        # A read-only working tree just means no caching.
+        pass
+
+
+def cache_root() -> Path:
+    return Path(os.getenv(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to a temp file beside ``path`` and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temp name per call, so concurrent writers in any process or thread
+    # never share a partially written file.
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as handle:
+        handle.write(text)
+    try:
+        os.replace(handle.name, path)
+    except OSError:
+        os.unlink(handle.name)
+        raise
+
+
+def _entry_path(key: str) -> Path:
+    return cache_root() / key[:2] / f"{key}.json"
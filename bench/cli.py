@@ -4,22 +4,15 @@ import argparse
 import json
 import os
 import webbrowser
-from collections import defaultdict
 from dataclasses import replace
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence
 
-from tabulate import tabulate
+import numpy as np
 
-from .experiment import ExperimentOptions, run_experiment
 from .harness import BenchmarkConfig, PricingConfig, load_config, run_benchmark, validate_config
 from .providers import ProviderFactory
-from .regression import RegressionThresholds, build_regression_report, write_regression_report
-from .report import (
-    aggregate_by_mode,
-    compute_mode_deltas,
-    generate_reports,
-)
+from .tables import render_github_table
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -56,6 +49,11 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Override repetitions per task/mode.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Override how many provider calls run at once in standard (non-orchestrated) runs.",
+    )
     parser.add_argument(
         "--judge",
         choices=["rule", "llm"],
@@ -98,7 +96,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--max-workers",
         type=int,
         default=4,
-        help="Max worker threads for orchestration mode (default: 4).",
+        help="Max workers for orchestration mode, regression analysis, and report chart rendering (default: 4).",
     )
     parser.add_argument(
         "--retry-attempts",
@@ -172,6 +170,16 @@ def build_parser() -> argparse.ArgumentParser:
         default=400,
         help="Permutation samples for p-values (default: 400).",
     )
+    parser.add_argument(
+        "--permutation-early-stop",
+        action="store_true",
+        help="Stop permutation tests early once the p-value is clearly above or below alpha.",
+    )
+    parser.add_argument(
+        "--screen-clear-passes",
+        action="store_true",
+        help="Skip bootstrap/permutation stats for comparisons whose delta is below the gate threshold.",
+    )
     parser.add_argument(
         "--percentiles",
         type=float,
@@ -228,6 +236,8 @@ def apply_overrides(config: BenchmarkConfig, args: argparse.Namespace, root: Pat
         updates["tasks"] = [normalise_path(task_path, root) for task_path in args.tasks]
     if args.repetitions is not None:
         updates["repetitions"] = max(1, int(args.repetitions))
+    if args.concurrency is not None:
+        updates["concurrency"] = max(1, int(args.concurrency))
     if args.judge:
         updates["judge"] = args.judge
     if args.skill_root:
@@ -267,51 +277,54 @@ def _resolve_to_path(path_value: str, root: Path) -> Path:
     return path
 
 
-def _percentile(values: Sequence[float], percentile: float) -> Optional[float]:
-    if not values:
-        return None
-    if percentile <= 0:
-        return min(values)
-    if percentile >= 100:
-        return max(values)
-    sorted_vals = sorted(values)
-    rank = (len(sorted_vals) - 1) * (percentile / 100)
-    lower = int(rank)
-    upper = min(lower + 1, len(sorted_vals) - 1)
-    weight = rank - lower
-    return sorted_vals[lower] * (1 - weight) + sorted_vals[upper] * weight
+_SUMMARY_METRICS = ("tokens_in", "tokens_out", "rule_score", "llm_score", "cost_usd")
 
 
-def latency_percentiles_by_mode(results: List[dict], percentiles: Sequence[float]) -> Dict[str, Dict[float, float]]:
-    by_mode: Dict[str, List[float]] = defaultdict(list)
+def summarize(
+    results: List[dict], percentiles: Sequence[float]
+) -> tuple[Dict[str, Dict[str, float]], Dict[str, Dict[float, float]]]:
+    """Return per-mode aggregates and requested latency percentiles for ``results``.
+
+    Aggregates come from ``report.aggregate_by_mode`` itself, so the console
+    summary rounds exactly like the written reports.
+    """
+    from .report import aggregate_by_mode
+
+    aggregates = aggregate_by_mode(results)
+    pcts = [max(0.0, min(100.0, float(percentile))) for percentile in percentiles]
+    percentile_map: Dict[str, Dict[float, float]] = {}
+    if not pcts:
+        return aggregates, percentile_map
+    latencies: Dict[str, List[float]] = {}
     for row in results:
-        by_mode[row["mode"]].append(row.get("latency_ms", 0.0))
-    output: Dict[str, Dict[float, float]] = {}
-    for mode, latencies in by_mode.items():
-        if not latencies:
-            continue
-        output[mode] = {}
-        for percentile in percentiles:
-            pct = max(0.0, min(100.0, float(percentile)))
-            value = _percentile(latencies, pct)
-            if value is not None:
-                output[mode][pct] = value
-    return output
+        latencies.setdefault(row["mode"], []).append(row.get("latency_ms", 0.0))
+    quantiles = np.asarray(pcts, dtype=np.float64) / 100.0
+    for mode, mode_latencies in latencies.items():
+        # np.quantile selects the needed order statistics with np.partition
+        # (introselect), so no full sort happens here.
+        values = np.quantile(np.asarray(mode_latencies, dtype=np.float64), quantiles)
+        percentile_map[mode] = {pct: float(value) for pct, value in zip(pcts, values)}
+    return aggregates, percentile_map
+
+
+def latency_percentiles_by_mode(results: List[dict], percentiles: Sequence[float]) -> Dict[str, Dict[float, float]]:
+    return summarize(results, percentiles)[1]
 
 
 def print_console_summary(results: List[dict], percentiles: Sequence[float]) -> None:
-    aggregates = aggregate_by_mode(results)
+    aggregates, percentile_map = summarize(results, percentiles)
     if not aggregates:
         print("No results produced.")
         return
+    from .report import compute_mode_deltas
+
     deltas = compute_mode_deltas(aggregates)
-    percentile_map = latency_percentiles_by_mode(results, percentiles)
 
     headers = ["mode", "latency_ms"]
     headers.extend(
         [f"latency_p{int(p) if float(p).is_integer() else float(p)}" for p in percentiles]
     )
-    headers.extend(["tokens_in", "tokens_out", "rule_score", "llm_score", "cost_usd"])
+    headers.extend(_SUMMARY_METRICS)
     rows = []
     for mode, metrics in sorted(aggregates.items()):
         row = [mode]
@@ -319,13 +332,13 @@ def print_console_summary(results: List[dict], percentiles: Sequence[float]) ->
         for percentile in percentiles:
             value = percentile_map.get(mode, {}).get(float(percentile))
             row.append(f"{value:.3f}" if value is not None else "")
-        for metric in ("tokens_in", "tokens_out", "rule_score", "llm_score", "cost_usd"):
-            value = aggregates[mode].get(metric)
+        for metric in _SUMMARY_METRICS:
+            value = metrics.get(metric)
             row.append(f"{value:.3f}" if isinstance(value, (int, float)) else "")
         rows.append(row)
 
     print("\nAverage metrics by mode")
-    print(tabulate(rows, headers=headers, tablefmt="github"))
+    print(render_github_table(headers, rows))
 
     if deltas:
         delta_headers = [
@@ -347,13 +360,19 @@ def print_console_summary(results: List[dict], percentiles: Sequence[float]) ->
                 row.append(f"{value:+.3f}" if isinstance(value, (int, float)) else "")
             delta_rows.append(row)
         print("\nDelta vs baseline (default percentiles)")
-        print(tabulate(delta_rows, headers=delta_headers, tablefmt="github"))
+        print(render_github_table(delta_headers, delta_rows))
 
 
 def main(argv: Optional[Iterable[str]] = None) -> None:
     parser = build_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
 
+    # Imported after parsing so `--help` and argument errors skip matplotlib
+    # and the statistics stack entirely.
+    from .experiment import ExperimentOptions, run_experiment
+    from .regression import RegressionThresholds, build_regression_report, write_regression_report
+    from .report import generate_reports
+
     config_path = _resolve_to_path(args.config, ROOT)
     config = load_config(config_path)
     config = apply_overrides(config, args, ROOT)
@@ -392,7 +411,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         results = run_benchmark(config, provider=provider)
 
     output_dir = _resolve_to_path(config.output_dir, ROOT)
-    artifacts = generate_reports(results, output_dir)
+    artifacts = generate_reports(results, output_dir, chart_workers=max(1, int(args.max_workers)))
 
     results_json_path = (
         Path(args.results_json).expanduser().resolve()
@@ -400,7 +419,8 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         else output_dir / "results.json"
     )
     results_json_path.parent.mkdir(parents=True, exist_ok=True)
-    results_json_path.write_text(json.dumps(results, indent=2))
+    with results_json_path.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
 
     print("Benchmark completed.")
     print(f"- Provider: {config.provider} (model: {config.model})")
@@ -427,8 +447,14 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         min_effect_size=float(args.min_effect_size),
         bootstrap_samples=max(50, int(args.bootstrap_samples)),
         permutation_samples=max(50, int(args.permutation_samples)),
+        permutation_early_stop=bool(args.permutation_early_stop),
+        screen_clear_passes=bool(args.screen_clear_passes),
+    )
+    regression_report = build_regression_report(
+        results,
+        regression_thresholds,
+        max_workers=max(1, int(args.max_workers)),
     )
-    regression_report = build_regression_report(results, regression_thresholds)
     regression_json_path: Path | None = None
     if args.regression_report:
         regression_json_path = _resolve_to_path(args.regression_report, ROOT)
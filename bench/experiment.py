@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
+import os
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
 
 from .harness import (
     BenchmarkConfig,
@@ -16,7 +21,7 @@ from .harness import (
     load_task,
 )
 from .judges import evaluate_output
-from .providers import ProviderFactory
+from .providers import BaseProvider, ProviderFactory
 
 
 @dataclass(frozen=True)
@@ -40,6 +45,13 @@ class ExperimentOptions:
 
 
 class _RateLimiter:
+    """Spaces provider calls ``1 / qps`` seconds apart across all workers.
+
+    The lock only guards reserving the next send slot (a few float operations);
+    callers sleep until their slot outside the lock, so waiting workers never
+    block each other.
+    """
+
     def __init__(self, qps: float):
         self._interval = 1.0 / qps if qps > 0 else 0.0
         self._lock = threading.Lock()
@@ -58,6 +70,47 @@ class _RateLimiter:
             time.sleep(sleep_for)
 
 
+class _CheckpointWriter:
+    """Append-only JSONL writer that flushes in batches rather than per record.
+
+    The file stays open for the whole run and is fsynced once on close, so a
+    finished run's checkpoint survives a crash without a sync per batch.
+    """
+
+    def __init__(self, path: Path, *, max_pending: int = 32, max_delay: float = 0.25):
+        self._fh = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        self._max_pending = max_pending
+        self._max_delay = max_delay
+        self._last_flush = time.monotonic()
+
+    def append(self, record: Dict) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._pending.append(line)
+            if (
+                len(self._pending) >= self._max_pending
+                or time.monotonic() - self._last_flush >= self._max_delay
+            ):
+                self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            try:
+                os.fsync(self._fh.fileno())
+            finally:
+                self._fh.close()
+
+    def _flush_locked(self) -> None:
+        if self._pending:
+            self._fh.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+            self._fh.flush()
+        self._last_flush = time.monotonic()
+
+
 def run_experiment(
     config: BenchmarkConfig,
     options: ExperimentOptions,
@@ -75,60 +128,67 @@ def run_experiment(
         for task_path in config.tasks
     }
 
+    prompt_cache = {
+        (mode, task_path): build_prompt(
+            mode=mode,
+            task=task_cache[task_path],
+            skill_root=skill_root,
+            skill=skill,
+        )
+        for task_path in config.tasks
+        for mode in config.modes
+    }
+
+    # One provider per model so every case for that model shares a client and
+    # its connection pool.
+    providers = {model: ProviderFactory.create(config.provider, model) for model in models}
+
     all_cases = _expand_cases(config, models=models, judges=judges)
 
     checkpoint_path = _resolve_checkpoint_path(options.checkpoint_path, base_dir)
     existing_records: List[Dict] = []
-    completed_keys: set[str] = set()
+    completed_cases: set[ExperimentCase] = set()
 
     if checkpoint_path and options.resume and checkpoint_path.exists():
-        existing_records, completed_keys = _load_checkpoint(checkpoint_path)
+        existing_records, completed_cases = _load_checkpoint(checkpoint_path)
     elif checkpoint_path and checkpoint_path.exists() and not options.resume:
         checkpoint_path.write_text("")
 
-    pending_cases = [
-        case
-        for case in all_cases
-        if _case_key(case.task_path, case.mode, case.model, case.judge, case.iteration) not in completed_keys
-    ]
+    pending_cases = [case for case in all_cases if case not in completed_cases]
 
     rate_limiter = _RateLimiter(options.rate_limit_qps)
-    checkpoint_lock = threading.Lock()
     writer = None
     if checkpoint_path:
         checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        writer = checkpoint_path.open("a", encoding="utf-8")
+        writer = _CheckpointWriter(checkpoint_path)
+
+    def run_case(case: ExperimentCase) -> Dict:
+        return _run_case(
+            case=case,
+            config=config,
+            task=task_cache[case.task_path],
+            prompt=prompt_cache[(case.mode, case.task_path)],
+            provider=providers[case.model],
+            rate_limiter=rate_limiter,
+        )
 
     results = list(existing_records)
     try:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _run_case,
-                    case=case,
-                    config=config,
-                    task=task_cache[case.task_path],
-                    skill_root=skill_root,
-                    skill=skill,
-                    rate_limiter=rate_limiter,
-                    retry_attempts=options.retry_attempts,
-                ): case
-                for case in pending_cases
-            }
-            for future in as_completed(futures):
-                record = future.result()
-                results.append(record)
-                completed_keys.add(_record_key(record))
-                if writer is not None:
-                    with checkpoint_lock:
-                        writer.write(json.dumps(record))
-                        writer.write("\n")
-                        writer.flush()
+        for record in _execute_cases(
+            pending_cases,
+            run_case,
+            max_workers=max_workers,
+            retry_attempts=max(0, int(options.retry_attempts)),
+        ):
+            results.append(record)
+            completed_cases.add(_record_case(record))
+            if writer is not None:
+                writer.append(record)
     finally:
         if writer is not None:
             writer.close()
 
-    results.sort(key=_sort_key)
+    results = _sort_records(results)
     metadata = {
         "total_cases": len(all_cases),
         "executed_cases": len(pending_cases),
@@ -138,22 +198,72 @@ def run_experiment(
 
 
 def _expand_cases(config: BenchmarkConfig, *, models: List[str], judges: List[str]) -> List[ExperimentCase]:
-    cases: List[ExperimentCase] = []
-    for task_path in config.tasks:
-        for mode in config.modes:
-            for model in models:
-                for judge in judges:
-                    for iteration in range(config.repetitions):
-                        cases.append(
-                            ExperimentCase(
-                                task_path=task_path,
-                                mode=mode,
-                                model=model,
-                                judge=judge,
-                                iteration=iteration,
-                            )
-                        )
-    return cases
+    # Field order of ExperimentCase matches the product order, so positional
+    # construction avoids a kwargs dict per case.
+    combos = itertools.product(config.tasks, config.modes, models, judges, range(config.repetitions))
+    return list(itertools.starmap(ExperimentCase, combos))
+
+
+def _execute_cases(
+    cases: List[ExperimentCase],
+    run_case: Callable[[ExperimentCase], Dict],
+    *,
+    max_workers: int,
+    retry_attempts: int,
+) -> Iterator[Dict]:
+    """Run ``cases`` on a thread pool and yield records as they complete.
+
+    At most ``2 * max_workers`` cases are in flight at once. A failed case is
+    not retried in place: it is parked on a heap until its backoff expires, so
+    no worker thread sleeps while other cases are ready to run.
+    """
+    window = max_workers * 2
+    case_iter = iter(cases)
+    retry_heap: List[Tuple[float, int, ExperimentCase, int]] = []
+    retry_seq = itertools.count()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: Dict[Future, Tuple[ExperimentCase, int]] = {}
+
+        def fill() -> None:
+            now = time.monotonic()
+            while len(in_flight) < window and retry_heap and retry_heap[0][0] <= now:
+                _, _, case, attempt = heapq.heappop(retry_heap)
+                in_flight[executor.submit(run_case, case)] = (case, attempt)
+            while len(in_flight) < window:
+                case = next(case_iter, None)
+                if case is None:
+                    break
+                in_flight[executor.submit(run_case, case)] = (case, 0)
+
+        fill()
+        while in_flight or retry_heap:
+            timeout = None
+            if retry_heap:
+                timeout = max(0.0, retry_heap[0][0] - time.monotonic())
+            if not in_flight:
+                time.sleep(timeout or 0.0)
+                fill()
+                continue
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                case, attempt = in_flight.pop(future)
+                try:
+                    record = future.result()
+                except Exception as exc:  # pragma: no cover - network/provider dependent
+                    if attempt >= retry_attempts:
+                        raise RuntimeError(
+                            f"Experiment case failed: task={case.task_path} mode={case.mode} "
+                            f"model={case.model} judge={case.judge} iteration={case.iteration}"
+                        ) from exc
+                    backoff = min(2.0, 0.25 * (2**attempt))
+                    heapq.heappush(
+                        retry_heap,
+                        (time.monotonic() + backoff, next(retry_seq), case, attempt + 1),
+                    )
+                    continue
+                yield record
+            fill()
 
 
 def _run_case(
@@ -161,57 +271,38 @@ def _run_case(
     case: ExperimentCase,
     config: BenchmarkConfig,
     task: dict,
-    skill_root: Path,
-    skill,
+    prompt: str,
+    provider: BaseProvider,
     rate_limiter: _RateLimiter,
-    retry_attempts: int,
 ) -> Dict:
-    prompt = build_prompt(
-        mode=case.mode,
+    rate_limiter.wait()
+    provider_result = provider.infer(prompt)
+    judges = evaluate_output(task, provider_result.output, case.judge, provider)
+    return build_record(
+        task_path=case.task_path,
         task=task,
-        skill_root=skill_root,
-        skill=skill,
+        mode=case.mode,
+        iteration=case.iteration,
+        prompt=prompt,
+        provider_result=provider_result,
+        judges=judges,
+        pricing=config.pricing,
+        provider_name=config.provider,
+        model_name=case.model,
+        judge_name=case.judge,
     )
-    for attempt in range(max(0, retry_attempts) + 1):
-        try:
-            provider = ProviderFactory.create(config.provider, case.model)
-            rate_limiter.wait()
-            provider_result = provider.infer(prompt)
-            judges = evaluate_output(task, provider_result.output, case.judge, provider)
-            return build_record(
-                task_path=case.task_path,
-                task=task,
-                mode=case.mode,
-                iteration=case.iteration,
-                prompt=prompt,
-                provider_result=provider_result,
-                judges=judges,
-                pricing=config.pricing,
-                provider_name=config.provider,
-                model_name=case.model,
-                judge_name=case.judge,
-            )
-        except Exception as exc:  # pragma: no cover - network/provider dependent
-            if attempt >= retry_attempts:
-                raise RuntimeError(
-                    f"Experiment case failed: task={case.task_path} mode={case.mode} "
-                    f"model={case.model} judge={case.judge} iteration={case.iteration}"
-                ) from exc
-            backoff = min(2.0, 0.25 * (2**attempt))
-            time.sleep(backoff)
-    raise RuntimeError("Unreachable retry state")
-
-
-def _load_checkpoint(path: Path) -> Tuple[List[Dict], set[str]]:
+
+
+def _load_checkpoint(path: Path) -> Tuple[List[Dict], set[ExperimentCase]]:
     records: List[Dict] = []
-    keys: set[str] = set()
-    with path.open("r", encoding="utf-8") as fh:
+    keys: set[ExperimentCase] = set()
+    with path.open("rb") as fh:
         for line in fh:
             payload = line.strip()
             if not payload:
                 continue
             record = json.loads(payload)
-            key = _record_key(record)
+            key = _record_case(record)
             if key in keys:
                 continue
             keys.add(key)
@@ -232,24 +323,25 @@ def _resolve_checkpoint_path(path_value: str | None, base_dir: Path) -> Path | N
     return _resolve_path(path_value, base_dir)
 
 
-def _case_key(task_path: str, mode: str, model: str, judge: str, iteration: int) -> str:
-    return "|".join([task_path, mode, model, judge, str(iteration)])
-
-
-def _record_key(record: Dict) -> str:
-    task_path = str(record.get("task_path", ""))
-    mode = str(record.get("mode", ""))
-    model = str(record.get("model", ""))
-    judge = str(record.get("judge", ""))
-    iteration = int(record.get("iteration", 0))
-    return _case_key(task_path, mode, model, judge, iteration)
-
-
-def _sort_key(record: Dict) -> Tuple[str, str, str, str, int]:
-    return (
+def _record_case(record: Dict) -> ExperimentCase:
+    return ExperimentCase(
         str(record.get("task_path", "")),
         str(record.get("mode", "")),
         str(record.get("model", "")),
         str(record.get("judge", "")),
         int(record.get("iteration", 0)),
     )
+
+
+def _sort_records(records: List[Dict]) -> List[Dict]:
+    """Order records by task, mode, model, judge, then iteration."""
+    if not records:
+        return []
+    columns = [
+        np.array([str(record.get(name, "")) for record in records])
+        for name in ("task_path", "mode", "model", "judge")
+    ]
+    iterations = np.array([int(record.get("iteration", 0)) for record in records], dtype=np.int64)
+    # np.lexsort treats the last key as primary.
+    order = np.lexsort((iterations, *reversed(columns)))
+    return [records[index] for index in order]
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
-import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import yaml
 
+from . import cache
 from .judges import JudgeResult, evaluate_output
-from .providers import BaseProvider, ProviderFactory, ProviderResult
+from .providers import BaseProvider, Prompt, ProviderFactory, ProviderResult
 
 
 @dataclass
@@ -24,6 +27,7 @@ class BenchmarkConfig:
     output_dir: str = "results"
     skill_root: Path = Path("skills/brand-voice")
     pricing: "PricingConfig | None" = None
+    concurrency: int = 1
 
 
 @dataclass
@@ -51,10 +55,13 @@ class SkillDefinition:
 ALLOWED_MODES = {"baseline", "naive", "progressive"}
 ALLOWED_JUDGES = {"rule", "llm"}
 
+# libyaml's C loader is much faster than the pure-Python one; both are "safe".
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(path: str | Path) -> BenchmarkConfig:
     config_path = Path(path)
-    data = yaml.safe_load(config_path.read_text())
+    data = _load_yaml_cached(config_path)
     pricing_data = data.get("pricing")
     pricing = None
     if isinstance(pricing_data, dict):
@@ -73,11 +80,48 @@ def load_config(path: str | Path) -> BenchmarkConfig:
         output_dir=data.get("output_dir", "results"),
         skill_root=Path(data.get("skill_root", "skills/brand-voice")),
         pricing=pricing,
+        concurrency=int(data.get("concurrency", 1)),
     )
     validate_config(config, base_dir=config_path.parent)
     return config
 
 
+def _load_yaml_cached(path: Path):
+    """Parse YAML at ``path``, reusing a JSON copy keyed by the file's content hash.
+
+    Copies are only read or written when ``SKILLBENCH_CACHE=1``; they live under
+    ``$SKILLBENCH_CACHE_DIR/configs`` beside the provider cache, never next to
+    the config.
+    """
+    raw = path.read_bytes()
+    if not cache.enabled():
+        return yaml.load(raw, Loader=YAML_LOADER)
+    cache_path = cache.cache_root() / "configs" / f"{hashlib.sha1(raw).hexdigest()}.json"
+    try:
+        return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    data = yaml.load(raw, Loader=YAML_LOADER)
+    if not _has_only_string_keys(data):
+        # JSON would turn int/bool keys into strings, so a cached load would differ.
+        return data
+    try:
+        cache.write_atomic(cache_path, json.dumps(data))
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache dirs or non-JSON YAML values (dates) simply skip the cache.
+        pass
+    return data
+
+
+def _has_only_string_keys(value: object) -> bool:
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _has_only_string_keys(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_has_only_string_keys(item) for item in value)
+    return True
+
+
 def validate_config(config: BenchmarkConfig, base_dir: Path | None = None) -> None:
     base = base_dir or Path(".")
     if not config.modes:
@@ -88,17 +132,21 @@ def validate_config(config: BenchmarkConfig, base_dir: Path | None = None) -> No
 
     if not config.tasks:
         raise ValueError("Config must list at least one task.")
-    missing_tasks = []
-    for task_path in config.tasks:
-        candidate = _resolve_with_base(task_path, base)
-        if candidate is None or not candidate.exists():
-            missing_tasks.append(task_path)
+    search_roots = [base, *base.parents]
+    missing_tasks = [
+        task_path
+        for task_path in dict.fromkeys(config.tasks)
+        if _resolve_with_base(task_path, search_roots) is None
+    ]
     if missing_tasks:
         raise FileNotFoundError(f"Task file(s) not found: {missing_tasks}")
 
     if config.repetitions < 1:
         raise ValueError("Repetitions must be >= 1.")
 
+    if config.concurrency < 1:
+        raise ValueError("Concurrency must be >= 1.")
+
     if config.judge not in ALLOWED_JUDGES:
         raise ValueError(f"Judge must be one of {sorted(ALLOWED_JUDGES)}")
 
@@ -106,12 +154,9 @@ def validate_config(config: BenchmarkConfig, base_dir: Path | None = None) -> No
         if config.pricing.input_per_1k < 0 or config.pricing.output_per_1k < 0:
             raise ValueError("Pricing rates must be non-negative.")
 
-    skill_root_resolved = _resolve_with_base(str(config.skill_root), base)
-    if skill_root_resolved is None or not skill_root_resolved.exists():
+    skill_root = _resolve_with_base(str(config.skill_root), search_roots)
+    if skill_root is None:
         raise FileNotFoundError(f"Skill root does not exist: {config.skill_root}")
-    skill_root = skill_root_resolved
-    if not skill_root.exists():
-        raise FileNotFoundError(f"Skill root does not exist: {skill_root}")
     skill_md = skill_root / "SKILL.md"
     if not skill_md.exists():
         raise FileNotFoundError(f"Missing SKILL.md at {skill_md}")
@@ -119,36 +164,54 @@ def validate_config(config: BenchmarkConfig, base_dir: Path | None = None) -> No
     validate_skill_metadata(metadata, skill_root)
 
 
-def _resolve_with_base(path_str: str, base: Path) -> Path | None:
+def _resolve_with_base(path_str: str, search_roots: List[Path]) -> Path | None:
+    """Return the first existing resolution of ``path_str`` under ``search_roots``."""
     path_obj = Path(path_str)
     if path_obj.is_absolute():
-        return path_obj
-    search_roots = [base, *base.parents]
+        return path_obj if os.path.exists(path_obj) else None
+    # Probe with one stat per root and only resolve (a realpath walk) the hit;
+    # the kernel follows symlinks before ``..`` just as resolve() does.
     for root in search_roots:
-        candidate = (root / path_obj).resolve()
-        if candidate.exists():
-            return candidate
-    # Return the immediate resolution even if missing so callers can inspect
-    return (base / path_obj).resolve()
+        candidate = root / path_obj
+        if os.path.exists(candidate):
+            return candidate.resolve()
+    return None
 
 
 SKILL_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*\Z")
 
 
 def parse_skill_markdown(skill_md_path: Path) -> tuple[dict, str]:
-    content = skill_md_path.read_text()
+    metadata, body = _split_frontmatter(_read_text(skill_md_path))
+    return dict(metadata), body
+
+
+# Frontmatter is memoized in-process only; it is cheap to parse and a file beside
+# SKILL.md would leak into the naive-mode blob.
+@lru_cache(maxsize=64)
+def _split_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith("---"):
         raise ValueError("SKILL.md must start with YAML frontmatter (---).")
     parts = content.split("---", 2)
     if len(parts) < 3:
         raise ValueError("SKILL.md frontmatter must be closed with ---.")
-    metadata = yaml.safe_load(parts[1]) or {}
+    metadata = yaml.load(parts[1], Loader=YAML_LOADER) or {}
     if not isinstance(metadata, dict):
         raise ValueError("SKILL.md frontmatter must be a YAML mapping.")
     body = parts[2].lstrip("\n")
     return metadata, body
 
 
+def _read_text(path: Path) -> str:
+    """Read a skill file, reusing the previous read while its mtime is unchanged."""
+    return _read_text_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _read_text_cached(path_str: str, mtime_ns: int) -> str:
+    return Path(path_str).read_text()
+
+
 def validate_skill_metadata(metadata: dict, skill_root: Path) -> None:
     name = metadata.get("name")
     description = metadata.get("description")
@@ -174,38 +237,45 @@ def validate_skill_metadata(metadata: dict, skill_root: Path) -> None:
 
 
 def run_benchmark(config: BenchmarkConfig, provider: Optional[BaseProvider] = None) -> List[Dict]:
-    results: List[Dict] = []
     provider = provider or ProviderFactory.create(config.provider, config.model)
     skill_root = config.skill_root
     skill = load_skill_definition(skill_root)
 
+    jobs = []
     for task_path in config.tasks:
         task = load_task(Path(task_path))
         for mode in config.modes:
+            # Prompts are a pure function of (mode, task, skill); repetitions reuse them.
+            prompt = build_prompt(
+                mode=mode,
+                task=task,
+                skill_root=skill_root,
+                skill=skill,
+            )
             for iteration in range(config.repetitions):
-                prompt = build_prompt(
-                    mode=mode,
-                    task=task,
-                    skill_root=skill_root,
-                    skill=skill,
-                )
-                provider_result = provider.infer(prompt)
-                judges = evaluate_output(task, provider_result.output, config.judge, provider)
-                record = build_record(
-                    task_path=task_path,
-                    task=task,
-                    mode=mode,
-                    iteration=iteration,
-                    prompt=prompt,
-                    provider_result=provider_result,
-                    judges=judges,
-                    pricing=config.pricing,
-                    provider_name=config.provider,
-                    model_name=config.model,
-                    judge_name=config.judge,
-                )
-                results.append(record)
-                time.sleep(0.02)  # keep results stable without hammering real APIs
+                jobs.append((task_path, task, mode, iteration, prompt))
+
+    prompts = [job[4] for job in jobs]
+    provider_results = provider.infer_batch(prompts, max_workers=config.concurrency)
+
+    results: List[Dict] = []
+    for (task_path, task, mode, iteration, prompt), provider_result in zip(jobs, provider_results):
+        judges = evaluate_output(task, provider_result.output, config.judge, provider)
+        results.append(
+            build_record(
+                task_path=task_path,
+                task=task,
+                mode=mode,
+                iteration=iteration,
+                prompt=prompt,
+                provider_result=provider_result,
+                judges=judges,
+                pricing=config.pricing,
+                provider_name=config.provider,
+                model_name=config.model,
+                judge_name=config.judge,
+            )
+        )
     return results
 
 
@@ -222,6 +292,8 @@ def build_record(
     model_name: str | None = None,
     judge_name: str | None = None,
 ) -> Dict:
+    tokens_in = provider_result.tokens_in
+    tokens_out = provider_result.tokens_out
     record: Dict = {
         "task_path": task_path,
         "task_id": task.get("id"),
@@ -230,14 +302,16 @@ def build_record(
         "prompt_chars": len(prompt),
         "output_chars": len(provider_result.output),
         "latency_ms": provider_result.latency_ms,
-        "tokens_in": provider_result.tokens_in,
-        "tokens_out": provider_result.tokens_out,
+        "tokens_in": tokens_in,
+        "tokens_out": tokens_out,
         "rule_score": judges.rule_score,
     }
+    if provider_result.tokens_cached is not None:
+        record["tokens_cached"] = provider_result.tokens_cached
     if judges.llm_score is not None:
         record["llm_score"] = judges.llm_score
     if pricing is not None:
-        cost = calculate_cost(provider_result.tokens_in, provider_result.tokens_out, pricing)
+        cost = calculate_cost(tokens_in, tokens_out, pricing)
         if cost is not None:
             record["cost_usd"] = cost
     if provider_name:
@@ -252,34 +326,56 @@ def build_record(
 def calculate_cost(tokens_in: Optional[int], tokens_out: Optional[int], pricing: PricingConfig) -> Optional[float]:
     if tokens_in is None and tokens_out is None:
         return None
-    in_cost = (tokens_in or 0) / 1000 * pricing.input_per_1k
-    out_cost = (tokens_out or 0) / 1000 * pricing.output_per_1k
-    return round(in_cost + out_cost, 6)
+    total = (tokens_in or 0) * pricing.input_per_1k + (tokens_out or 0) * pricing.output_per_1k
+    return round(total / 1000, 6)
 
 
 def load_task(path: Path) -> dict:
-    return json.loads(Path(path).read_text())
+    """Load a task JSON file.
+
+    Parsed tasks are memoized by path, mtime and size, so the returned dict is
+    shared between callers and must be treated as read-only.
+    """
+    stat = Path(path).stat()
+    return _load_task_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
 
+@lru_cache(maxsize=256)
+def _load_task_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    return json.loads(Path(path_str).read_bytes())
 
-def build_prompt(mode: str, task: dict, skill_root: Path, skill: SkillDefinition) -> str:
+
+# Separates skill context from the task prompt in naive and progressive modes.
+TASK_DIVIDER = "\n\n---\n"
+
+
+def build_prompt(mode: str, task: dict, skill_root: Path, skill: SkillDefinition) -> Prompt:
+    """Assemble the prompt for ``mode``, recording where skill context and task split."""
+    task_prompt = format_task_prompt(task)
     if mode == "baseline":
-        return format_task_prompt(task)
+        return Prompt(task_prompt)
     if mode == "naive":
-        skill_blob = load_skill_blob(skill_root)
-        return f"{skill_blob}\n\n---\n{format_task_prompt(task)}"
-    if mode == "progressive":
+        context = load_skill_blob(skill_root)
+        prompt = f"{context}{TASK_DIVIDER}{task_prompt}"
+    elif mode == "progressive":
         section = select_section(task, skill.sections)
-        skill_md = (skill_root / "SKILL.md").read_text().strip()
+        skill_md = _read_text(skill_root / "SKILL.md").strip()
         reference_blocks = "\n".join(
-            f"[reference: {ref}]\n{(skill_root / ref).read_text()}"
+            f"[reference: {ref}]\n{_read_text(skill_root / ref)}"
             for ref in section.references
         )
         parts = [skill_md, f"[selected-section: {section.title}]"]
         if reference_blocks:
             parts.append(reference_blocks)
-        parts.append(f"---\n{format_task_prompt(task)}")
-        return "\n\n".join(part for part in parts if part).strip()
-    raise ValueError(f"Unknown mode '{mode}'")
+        # The context never starts with whitespace (it leads with the stripped
+        # SKILL.md or the section marker), so strip() only trims the task's tail.
+        context = "\n\n".join(part for part in parts if part)
+        prompt = f"{context}{TASK_DIVIDER}{task_prompt}".strip()
+    else:
+        raise ValueError(f"Unknown mode '{mode}'")
+    if not context:
+        return Prompt(prompt)
+    return Prompt(prompt, context_end=len(context), task_start=len(context) + len(TASK_DIVIDER))
 
 
 def format_task_prompt(task: dict) -> str:
@@ -287,16 +383,28 @@ def format_task_prompt(task: dict) -> str:
 
 
 def load_skill_blob(skill_root: Path) -> str:
-    parts: List[str] = []
-    for path in sorted(skill_root.rglob("*")):
-        if path.is_file() and not path.name.startswith(".") and "__pycache__" not in path.parts:
-            rel = path.relative_to(skill_root)
-            parts.append(f"[file: {rel}]\n{path.read_text()}")
-    return "\n\n".join(parts)
+    files = sorted(_iter_skill_files(str(skill_root), ()))
+    return "\n\n".join(
+        f"[file: {'/'.join(parts)}]\n{_read_text(Path(path))}" for parts, path in files
+    )
+
+
+def _iter_skill_files(directory: str, prefix: tuple[str, ...]) -> Iterator[tuple[tuple[str, ...], str]]:
+    """Yield ``(relative_parts, path)`` for skill files, pruning hidden and ``__pycache__`` dirs."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name == "__pycache__":
+                continue
+            parts = (*prefix, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_skill_files(entry.path, parts)
+            elif entry.is_file():
+                yield parts, entry.path
 
 
 KEYWORDS_RE = re.compile(r"(?:\*\*|__)?keywords?(?:\*\*|__)?\s*:\s*(.+)", re.IGNORECASE)
 PATH_TOKEN_RE = re.compile(r"(?<![\w/.-])([\w./-]+\.[A-Za-z0-9]+)")
+MARKDOWN_LINK_TARGET_RE = re.compile(r"\\(([^)]+)\\)")
 
 
 def load_skill_definition(skill_root: Path) -> SkillDefinition:
@@ -311,32 +419,34 @@ def load_skill_definition(skill_root: Path) -> SkillDefinition:
 
 
 def parse_skill_sections(body: str, skill_root: Path) -> List[SkillSection]:
-    sections = _parse_sections_by_heading(body, "### ", skill_root)
-    if not sections:
-        sections = _parse_sections_by_heading(body, "## ", skill_root)
-    if not sections:
-        sections.append(_build_section("default", body.splitlines(), skill_root))
-    return sections
-
-
-def _parse_sections_by_heading(body: str, marker: str, skill_root: Path) -> List[SkillSection]:
-    sections: List[SkillSection] = []
-    current_title: Optional[str] = None
-    current_lines: List[str] = []
-
+    grouped = _split_sections_by_heading(body, ("### ", "## "))
+    for marker in ("### ", "## "):
+        if grouped[marker]:
+            return [_build_section(title, lines, skill_root) for title, lines in grouped[marker]]
+    return [_build_section("default", body.splitlines(), skill_root)]
+
+
+def _split_sections_by_heading(
+    body: str, markers: Iterable[str]
+) -> Dict[str, List[tuple[str, List[str]]]]:
+    """Split ``body`` into ``(title, lines)`` groups for every heading marker in one pass.
+
+    Each marker is tracked independently: a section runs from its heading to the
+    next heading with the same marker.
+    """
+    grouped: Dict[str, List[tuple[str, List[str]]]] = {marker: [] for marker in markers}
+    current: Dict[str, Optional[List[str]]] = {marker: None for marker in grouped}
     for line in body.splitlines():
-        if line.startswith(marker):
-            if current_title is not None:
-                sections.append(_build_section(current_title, current_lines, skill_root))
-            current_title = line[len(marker):].strip()
-            current_lines = []
-            continue
-        if current_title is not None:
-            current_lines.append(line)
-
-    if current_title is not None:
-        sections.append(_build_section(current_title, current_lines, skill_root))
-    return sections
+        for marker, sections in grouped.items():
+            if line.startswith(marker):
+                lines: List[str] = []
+                sections.append((line[len(marker):].strip(), lines))
+                current[marker] = lines
+                continue
+            open_lines = current[marker]
+            if open_lines is not None:
+                open_lines.append(line)
+    return grouped
 
 
 def _build_section(title: str, lines: Iterable[str], skill_root: Path) -> SkillSection:
@@ -363,46 +473,38 @@ def _extract_keywords(text: str) -> List[str]:
 
 
 def _extract_references(text: str, skill_root: Path) -> List[str]:
-    candidates = set()
-    for match in re.findall(r"\\(([^)]+)\\)", text):
-        candidates.add(match.strip())
-    for match in PATH_TOKEN_RE.findall(text):
-        candidates.add(match.strip())
+    # dict.fromkeys keeps discovery order so prompts list references deterministically.
+    candidates = dict.fromkeys(
+        match.strip()
+        for pattern in (MARKDOWN_LINK_TARGET_RE, PATH_TOKEN_RE)
+        for match in pattern.findall(text)
+    )
 
     refs: List[str] = []
     seen: set[str] = set()
-    root = skill_root.resolve()
+    root_str = os.fspath(skill_root)
+    root_prefix = os.path.join(os.path.realpath(root_str), "")
 
     for candidate in candidates:
         cleaned = candidate.strip().strip("`")
         if not cleaned or "://" in cleaned or cleaned.startswith("mailto:"):
             continue
         cleaned = cleaned.split("#", 1)[0].split("?", 1)[0].strip()
-        if not cleaned:
-            continue
-        path = Path(cleaned)
-        if path.is_absolute():
+        if not cleaned or os.path.isabs(cleaned):
             continue
-        resolved = (skill_root / path).resolve()
-        if not resolved.exists() or not resolved.is_file():
+        # Check the realpath, not a normpath: ``build_prompt`` reads ``skill_root / ref``
+        # and the kernel follows symlinks before ``..``, so only the resolved path says
+        # which file will actually be inlined.
+        resolved = os.path.realpath(os.path.join(root_str, cleaned))
+        if not resolved.startswith(root_prefix) or not os.path.isfile(resolved):
             continue
-        if not _is_within_root(resolved, root):
-            continue
-        rel = path.as_posix()
+        rel = Path(cleaned).as_posix()
         if rel not in seen:
             seen.add(rel)
             refs.append(rel)
     return refs
 
 
-def _is_within_root(path: Path, root: Path) -> bool:
-    try:
-        path.relative_to(root)
-    except ValueError:
-        return False
-    return True
-
-
 def _dedupe(values: Iterable[str]) -> List[str]:
     seen: set[str] = set()
     output: List[str] = []
@@ -419,6 +521,15 @@ def select_section(task: dict, sections: List[SkillSection]) -> SkillSection:
         raise ValueError("No sections parsed from SKILL.md")
     task_text = " ".join([task.get("id", ""), task.get("goal", ""), task.get("input", "")]).lower()
     for section in sections:
-        if any(cue.lower() in task_text for cue in section.cues):
+        pattern = _cue_pattern(tuple(section.cues))
+        if pattern is not None and pattern.search(task_text):
             return section
     return sections[0]
+
+
+@lru_cache(maxsize=256)
+def _cue_pattern(cues: tuple[str, ...]) -> "re.Pattern[str] | None":
+    """Compile a section's cues into one alternation so the task text is scanned once."""
+    if not cues:
+        return None
+    return re.compile("|".join(re.escape(cue.lower()) for cue in cues))
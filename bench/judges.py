@@ -1,47 +1,56 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Optional
+from typing import Optional, Sequence
 
 from .providers import BaseProvider, MockProvider
 
 
 # --- Rule-based scorers ----------------------------------------------------
 
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]")
+
+
+@lru_cache(maxsize=256)
+def _banned_word_patterns(words: Sequence[str]) -> tuple[re.Pattern[str], ...]:
+    return tuple(re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE) for word in words)
+
+
 def score_brand_guidelines(text: str, rules: dict) -> float:
     penalties = 0
-    banned = rules.get("avoid", [])
-    for word in banned:
-        if re.search(rf"\b{re.escape(word)}\b", text, flags=re.IGNORECASE):
+    banned = tuple(rules.get("avoid", []))
+    # One penalty per distinct banned word present, regardless of repeats.
+    for pattern in _banned_word_patterns(banned):
+        if pattern.search(text):
             penalties += 1
-    sentences = [s.strip() for s in re.split(r"[.!?]", text) if s.strip()]
+    sentences = [s.strip() for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
     long_sentences = sum(1 for s in sentences if len(s.split()) > 26)
     penalties += long_sentences * 0.5
     return float(max(0.0, 1.0 - 0.2 * penalties))
 
 
 def score_policy_format(text: str, rules: dict) -> float:
-    lines = [line.strip() for line in text.strip().splitlines() if line.strip()]
-    if not lines:
+    heading, bullets = _heading_and_bullets(text)
+    if heading is None:
         return 0.0
-    bullets = [ln for ln in lines[1:] if ln.startswith(("-", "*"))]
-    heading = lines[0]
     expected_case = rules.get("heading_case", "sentence")
     heading_ok = expected_case == "sentence" and is_sentence_case(heading)
     bullets_ok = rules.get("format") == "bullets" and len(bullets) >= 2
     return 1.0 if heading_ok and bullets_ok else 0.5
 
 
+NUMERIC_MENTION_RE = re.compile(r"[\d%]")
+
+
 def score_metrics_report(text: str, rules: dict) -> float:
-    lines = [line.strip() for line in text.strip().splitlines() if line.strip()]
-    if not lines:
+    headline, bullets = _heading_and_bullets(text)
+    if headline is None:
         return 0.0
-    headline = lines[0]
     target_bullets = int(rules.get("bullets", 3))
-    bullets = [ln for ln in lines[1:] if ln.startswith(("-", "*"))]
     bullet_count_ok = len(bullets) == target_bullets
-    percent_mentions = sum(1 for ln in bullets if "%" in ln or any(char.isdigit() for char in ln))
+    percent_mentions = sum(1 for ln in bullets if NUMERIC_MENTION_RE.search(ln))
     percent_ok = percent_mentions >= min(2, target_bullets)
     exclamation = "!" in text
     tone_ok = rules.get("tone") == "analytical" and not exclamation
@@ -53,13 +62,27 @@ def score_metrics_report(text: str, rules: dict) -> float:
     return 0.5
 
 
+def _heading_and_bullets(text: str) -> tuple[Optional[str], list[str]]:
+    """Return the first non-blank line and the bullet lines after it, in one pass."""
+    heading: Optional[str] = None
+    bullets: list[str] = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if heading is None:
+            heading = line
+        elif line[0] in "-*":
+            bullets.append(line)
+    return heading, bullets
+
+
 def is_sentence_case(text: str) -> bool:
     stripped = text.strip()
     if not stripped:
         return False
     rest = stripped[1:]
-    target = "".join(ch.lower() if ch.isalpha() else ch for ch in rest)
-    return stripped[0].isupper() and rest == target
+    return stripped[0].isupper() and rest == rest.lower()
 
 
 def score_rule(task_json: dict, output: str) -> float:
@@ -88,6 +111,9 @@ Assistant output:
 Provide a single integer rating from 1 (non-compliant) to 5 (fully compliant) preceded by 'score:'."""
 
 
+LLM_SCORE_RE = re.compile(r"score:\s*([1-5])")
+
+
 @dataclass
 class JudgeResult:
     rule_score: float
@@ -102,7 +128,7 @@ def llm_score(task_json: dict, output: str, provider: BaseProvider) -> float:
         output=output,
     )
     result = provider.infer(prompt)
-    match = re.search(r"score:\s*([1-5])", result.output)
+    match = LLM_SCORE_RE.search(result.output)
     if match:
         return float(int(match.group(1)))
     # Fall back to rule score scaled to 1-5 for deterministic mocks.
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import re
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Sequence, Type, TypeVar
+
+
+PROMPT_CACHING_ENV = "SKILLBENCH_PROMPT_CACHING"
+
+
+class Prompt(str):
+    """Prompt text that records where its reusable skill context ends.
+
+    ``build_prompt`` returns these with ``prompt[:context_end]`` holding the skill
+    context and ``prompt[task_start:]`` the task; both are 0 when there is no
+    context. Providers read the offsets instead of searching the text, which may
+    contain anything the task input does.
+    """
+
+    context_end: int
+    task_start: int
+
+    def __new__(cls, text: str, *, context_end: int = 0, task_start: int = 0) -> "Prompt":
+        prompt = super().__new__(cls, text)
+        prompt.context_end = context_end
+        prompt.task_start = task_start
+        return prompt
 
 
 @dataclass
@@ -13,6 +38,8 @@ class ProviderResult:
     tokens_in: Optional[int]
     tokens_out: Optional[int]
     latency_ms: float
+    # Input tokens served from the provider's prompt cache (already counted in tokens_in).
+    tokens_cached: Optional[int] = None
 
 
 class BaseProvider(ABC):
@@ -25,7 +52,56 @@ class BaseProvider(ABC):
     def infer(self, prompt: str) -> ProviderResult:
         raise NotImplementedError
 
+    def infer_batch(self, prompts: Sequence[str], *, max_workers: int = 1) -> List[ProviderResult]:
+        """Run ``infer`` for every prompt, returning results in input order.
+
+        With ``max_workers > 1`` calls overlap on a thread pool so network round
+        trips are not serialised. Providers with a native batch API can override this.
+        """
+        if max_workers <= 1 or len(prompts) <= 1:
+            return [self.infer(prompt) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(self.infer, prompts))
+
+    async def ainfer(self, prompt: str) -> ProviderResult:
+        """Awaitable ``infer``. Defaults to running ``infer`` on a worker thread."""
+        return await asyncio.to_thread(self.infer, prompt)
+
+
+async def run_batch(
+    provider: BaseProvider,
+    prompts: Sequence[str],
+    *,
+    concurrency: int = 32,
+) -> List[ProviderResult]:
+    """Await ``provider.ainfer`` for every prompt with at most ``concurrency`` in flight.
 
+    Results are returned in input order. Sync callers can use ``asyncio.run``.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(prompt: str) -> ProviderResult:
+        async with semaphore:
+            return await provider.ainfer(prompt)
+
+    return list(await asyncio.gather(*(bounded(prompt) for prompt in prompts)))
+
+
+_REGISTRY: Dict[str, Type[BaseProvider]] = {}
+_P = TypeVar("_P", bound=Type[BaseProvider])
+
+
+def register(name: str) -> Callable[[_P], _P]:
+    """Class decorator that makes a provider available to ``ProviderFactory`` as ``name``."""
+
+    def decorator(cls: _P) -> _P:
+        _REGISTRY[name.lower()] = cls
+        return cls
+
+    return decorator
+
+
+@register("mock")
 class MockProvider(BaseProvider):
     """Deterministic mock provider that fabricates outputs for repeatable tests."""
 
@@ -47,68 +123,167 @@ class MockProvider(BaseProvider):
 
     @staticmethod
     def _craft_output(prompt: str) -> str:
-        prompt_lower = prompt.lower()
-        if "rewrite the sentence" in prompt_lower or "brand voice" in prompt_lower:
-            return (
-                "We are announcing a focused feature that improves daily workflows. "
-                "It is reliable, practical, and ready for teams."
-            )
-        if "reformat the following policy text" in prompt_lower or "policy" in prompt_lower:
-            return (
-                "Policy: data handling\n"
-                "- Store customer data securely.\n"
-                "- Never share customer information.\n"
-                "- Use exact numbers when they are provided."
-            )
-        if "summarize the following quarterly metrics" in prompt_lower or "metrics" in prompt_lower:
-            return (
-                "Product engagement rose 8% quarter over quarter while stability improved.\n"
-                "- Active users increased 8% QoQ driven by new onboarding flows.\n"
-                "- Churn fell 2 points as support SLAs stabilized.\n"
-                "- Response time dropped from 480 ms to 410 ms after the caching rollout."
-            )
-        return "Mock response generated for benchmarking."
+        return _route_mock_output(prompt)
+
 
+# Canned outputs in priority order: the first route with any keyword present wins.
+_MOCK_ROUTES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (
+        ("rewrite the sentence", "brand voice"),
+        "We are announcing a focused feature that improves daily workflows. "
+        "It is reliable, practical, and ready for teams.",
+    ),
+    (
+        ("reformat the following policy text", "policy"),
+        "Policy: data handling\n"
+        "- Store customer data securely.\n"
+        "- Never share customer information.\n"
+        "- Use exact numbers when they are provided.",
+    ),
+    (
+        ("summarize the following quarterly metrics", "metrics"),
+        "Product engagement rose 8% quarter over quarter while stability improved.\n"
+        "- Active users increased 8% QoQ driven by new onboarding flows.\n"
+        "- Churn fell 2 points as support SLAs stabilized.\n"
+        "- Response time dropped from 480 ms to 410 ms after the caching rollout.",
+    ),
+)
+_MOCK_FALLBACK = "Mock response generated for benchmarking."
+_MOCK_ROUTE_BY_KEYWORD = {
+    keyword: index for index, (keywords, _) in enumerate(_MOCK_ROUTES) for keyword in keywords
+}
+_MOCK_ROUTER_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_MOCK_ROUTE_BY_KEYWORD, key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
+
+def _route_mock_output(prompt: str) -> str:
+    # One case-insensitive scan collects every keyword present; priority is then
+    # resolved by route order rather than by position in the prompt.
+    routes = {_MOCK_ROUTE_BY_KEYWORD[match.lower()] for match in _MOCK_ROUTER_RE.findall(prompt)}
+    if not routes:
+        return _MOCK_FALLBACK
+    return _MOCK_ROUTES[min(routes)][1]
+
+
+@register("anthropic")
 class AnthropicProvider(BaseProvider):
     """Proxy to Anthropic's Messages API with graceful fallback when no key is present."""
 
-    def __init__(self, model: str):
+    def __init__(self, model: str, *, prompt_caching: bool | None = None):
         super().__init__(model)
+        # Off by default: moving the skill context into a cached system block changes
+        # what is measured, and caching shortens large naive prompts far more than
+        # progressive ones, which would bias mode latency comparisons.
+        if prompt_caching is None:
+            prompt_caching = os.getenv(PROMPT_CACHING_ENV, "") == "1"
+        self.prompt_caching = prompt_caching
         try:
             import anthropic  # type: ignore
 
-            self.client = anthropic.Anthropic()
+            http_client = _build_http_client()
+            if http_client is not None:
+                self.client = anthropic.Anthropic(http_client=http_client)
+            else:
+                self.client = anthropic.Anthropic()
             self._has_client = True
         except Exception:
             self.client = None
             self._has_client = False
+        # Created on first ``ainfer`` so sync-only runs never build an event-loop client.
+        self._async_client = None
 
     def infer(self, prompt: str) -> ProviderResult:
         t0 = time.perf_counter()
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not self._has_client or not api_key or self.client is None:
-            latency_ms = (time.perf_counter() - t0) * 1000
-            message = "[no-key] " + prompt[:160]
-            tokens = MockProvider._estimate_tokens  # reuse heuristic for placeholder
-            return ProviderResult(
-                output=message,
-                tokens_in=tokens(prompt),
-                tokens_out=tokens(message),
-                latency_ms=latency_ms,
-            )
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=512,
-            messages=[{"role": "user", "content": prompt}],
+        client = self.client
+        if client is None or not self._can_call():
+            return self._placeholder_result(prompt, t0)
+        from . import cache
+
+        key = cache.cache_key(self.model, prompt) if cache.enabled() else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        response = client.messages.create(**self._request_kwargs(prompt))
+        result = self._to_result(response, t0)
+        if key is not None:
+            cache.put(key, result)
+        return result
+
+    async def ainfer(self, prompt: str) -> ProviderResult:
+        t0 = time.perf_counter()
+        if not self._can_call():
+            return self._placeholder_result(prompt, t0)
+        from . import cache
+
+        key = cache.cache_key(self.model, prompt) if cache.enabled() else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        if self._async_client is None:
+            import anthropic  # type: ignore
+
+            self._async_client = anthropic.AsyncAnthropic()
+        response = await self._async_client.messages.create(**self._request_kwargs(prompt))
+        result = self._to_result(response, t0)
+        if key is not None:
+            cache.put(key, result)
+        return result
+
+    def _can_call(self) -> bool:
+        return self._has_client and self.client is not None and bool(os.getenv("ANTHROPIC_API_KEY"))
+
+    def _request_kwargs(self, prompt: str) -> dict:
+        kwargs: dict = {"model": self.model, "max_tokens": 512}
+        context_end = getattr(prompt, "context_end", 0)
+        if self.prompt_caching and context_end > 0:
+            # Skill context shared across tasks goes in a cacheable system block;
+            # only the per-task goal/input is sent as the user turn.
+            kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": prompt[:context_end],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            prompt = prompt[getattr(prompt, "task_start", 0):]
+        kwargs["messages"] = [{"role": "user", "content": str(prompt)}]
+        return kwargs
+
+    @staticmethod
+    def _placeholder_result(prompt: str, t0: float) -> ProviderResult:
+        latency_ms = (time.perf_counter() - t0) * 1000
+        message = "[no-key] " + prompt[:160]
+        tokens = MockProvider._estimate_tokens  # reuse heuristic for placeholder
+        return ProviderResult(
+            output=message,
+            tokens_in=tokens(prompt),
+            tokens_out=tokens(message),
+            latency_ms=latency_ms,
         )
+
+    def _to_result(self, response: object, t0: float) -> ProviderResult:
         latency_ms = (time.perf_counter() - t0) * 1000
         output = self._normalise_response(response)
         usage = getattr(response, "usage", None)
         tokens_in = getattr(usage, "input_tokens", None)
         tokens_out = getattr(usage, "output_tokens", None)
-        return ProviderResult(output=output, tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms)
+        # The API reports cache reads/writes separately from input_tokens. Fold them
+        # back in so tokens_in stays the full prompt size across modes.
+        tokens_cached = getattr(usage, "cache_read_input_tokens", None)
+        cache_written = getattr(usage, "cache_creation_input_tokens", None)
+        if tokens_in is not None:
+            tokens_in += (tokens_cached or 0) + (cache_written or 0)
+        return ProviderResult(
+            output=output,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            latency_ms=latency_ms,
+            tokens_cached=tokens_cached,
+        )
 
     @staticmethod
     def _normalise_response(response: object) -> str:
@@ -121,14 +296,32 @@ class AnthropicProvider(BaseProvider):
         return str(response)
 
 
+def _build_http_client() -> object | None:
+    """Return an HTTP/2 ``httpx.Client`` sized for concurrent runs, or None.
+
+    HTTP/2 lets concurrent ``infer`` calls multiplex over one connection. It needs
+    the optional ``h2`` package (``pip install "httpx[http2]"``); without it the SDK's
+    default client is used.
+    """
+    try:
+        import h2  # type: ignore  # noqa: F401
+        import httpx  # type: ignore
+    except ImportError:
+        return None
+    return httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(60.0),
+        limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+    )
+
+
 class ProviderFactory:
     """Utility to construct providers while keeping harness configuration simple."""
 
     @staticmethod
     def create(provider_name: str, model: str) -> BaseProvider:
-        name = provider_name.lower()
-        if name == "anthropic":
-            return AnthropicProvider(model)
-        if name == "mock":
-            return MockProvider(model)
-        raise ValueError(f"Unknown provider '{provider_name}'")
+        try:
+            provider_cls = _REGISTRY[provider_name.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown provider '{provider_name}'") from None
+        return provider_cls(model)
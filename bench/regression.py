@@ -3,14 +3,17 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from statistics import fmean
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, Tuple
 
-from tabulate import tabulate
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .tables import render_github_table
 
 
 @dataclass
@@ -24,6 +27,11 @@ class RegressionThresholds:
     permutation_samples: int = 400
     confidence: float = 0.95
     random_seed: int = 17
+    permutation_early_stop: bool = False
+    screen_clear_passes: bool = False
+
+
+REGRESSION_METRICS = ("latency_ms", "rule_score", "cost_usd")
 
 
 def build_regression_report(
@@ -31,8 +39,8 @@ def build_regression_report(
     thresholds: RegressionThresholds,
     *,
     baseline_mode: str = "baseline",
+    max_workers: int = 1,
 ) -> Dict:
-    metrics = ("latency_ms", "rule_score", "cost_usd")
     grouped: Dict[Tuple[str, str, str], Dict[str, Dict[str, List[float]]]] = {}
     for row in results:
         group = (
@@ -40,66 +48,122 @@ def build_regression_report(
             str(row.get("model", "")),
             str(row.get("judge", "")),
         )
-        mode = str(row.get("mode", ""))
-        grouped.setdefault(group, {}).setdefault(mode, {})
-        for metric in metrics:
+        metric_map = grouped.setdefault(group, {}).setdefault(str(row.get("mode", "")), {})
+        for metric in REGRESSION_METRICS:
             value = row.get(metric)
             if isinstance(value, (int, float)):
-                grouped[group][mode].setdefault(metric, []).append(float(value))
+                metric_map.setdefault(metric, []).append(float(value))
+
+    # Columnar view: each (group, mode, metric) sample becomes one contiguous float64
+    # array, converted once and shared by the mean, bootstrap, permutation, and
+    # effect-size computations below.
+    samples: Dict[Tuple[str, str, str], Dict[str, Dict[str, np.ndarray]]] = {
+        group: {
+            mode: {metric: np.asarray(values, dtype=np.float64) for metric, values in metric_map.items()}
+            for mode, metric_map in mode_map.items()
+        }
+        for group, mode_map in grouped.items()
+    }
+
+    def compare(item: Tuple[Tuple[str, str, str], Dict[str, Dict[str, np.ndarray]]]) -> List[Dict]:
+        return _compare_group(item[0], item[1], baseline_mode=baseline_mode, thresholds=thresholds)
+
+    # Every comparison seeds its own RNG from _stable_seed, so groups are independent
+    # and the report is identical whether or not they run concurrently.
+    items = sorted(samples.items())
+    if max_workers > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            per_group = list(executor.map(compare, items))
+    else:
+        per_group = [compare(item) for item in items]
+
+    comparisons = [comparison for group_comparisons in per_group for comparison in group_comparisons]
+    regressions = [comparison for comparison in comparisons if comparison["regression"]]
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "baseline_mode": baseline_mode,
+        "thresholds": asdict(thresholds),
+        "total_records": len(results),
+        "comparison_count": len(comparisons),
+        "regression_count": len(regressions),
+        "passed": len(regressions) == 0,
+        "comparisons": comparisons,
+        "regressions": regressions,
+    }
+    return report
 
-    comparisons: List[Dict] = []
-    regressions: List[Dict] = []
 
-    for group_key, mode_map in sorted(grouped.items()):
-        task_id, model, judge = group_key
-        baseline_metrics = mode_map.get(baseline_mode, {})
-        if not baseline_metrics:
+def _compare_group(
+    group_key: Tuple[str, str, str],
+    mode_map: Dict[str, Dict[str, np.ndarray]],
+    *,
+    baseline_mode: str,
+    thresholds: RegressionThresholds,
+) -> List[Dict]:
+    task_id, model, judge = group_key
+    baseline_metrics = mode_map.get(baseline_mode, {})
+    if not baseline_metrics:
+        return []
+    comparisons: List[Dict] = []
+    for mode, metric_map in sorted(mode_map.items()):
+        if mode == baseline_mode:
             continue
-        for mode, metric_map in sorted(mode_map.items()):
-            if mode == baseline_mode:
+        # The metrics of one (group, mode) pair usually share sample sizes, so their
+        # resample and permutation indices are drawn once and reused per metric.
+        seed = _stable_seed(f"{thresholds.random_seed}|{task_id}|{model}|{judge}|{mode}")
+        draws = _SharedDraws(np.random.default_rng(seed), thresholds)
+        for metric in REGRESSION_METRICS:
+            baseline_values = baseline_metrics.get(metric)
+            candidate_values = metric_map.get(metric)
+            if baseline_values is None or candidate_values is None:
                 continue
-            for metric in metrics:
-                baseline_values = baseline_metrics.get(metric, [])
-                candidate_values = metric_map.get(metric, [])
-                if not baseline_values or not candidate_values:
-                    continue
-
-                seed = _stable_seed(
-                    f"{thresholds.random_seed}|{task_id}|{model}|{judge}|{mode}|{metric}"
+
+            baseline_mean = float(baseline_values.mean())
+            candidate_mean = float(candidate_values.mean())
+            delta = candidate_mean - baseline_mean
+            delta_pct = None
+            if baseline_mean != 0:
+                delta_pct = (delta / abs(baseline_mean)) * 100.0
+            effect_size = cohens_d(candidate_values, baseline_values)
+            effect_ok = abs(effect_size) >= thresholds.min_effect_size
+            # A comparison below its threshold can never be flagged, so the resampling
+            # statistics are optional there and skipped when screening is enabled.
+            screened = thresholds.screen_clear_passes and not _exceeds_threshold(
+                metric=metric, delta=delta, delta_pct=delta_pct, thresholds=thresholds
+            )
+            ci_low = ci_high = p_value = None
+            significant = False
+            if not screened:
+                bootstrap_indices, permutations = draws.get(
+                    baseline_values.size, candidate_values.size
                 )
-                rng = random.Random(seed)
-                baseline_mean = fmean(baseline_values)
-                candidate_mean = fmean(candidate_values)
-                delta = candidate_mean - baseline_mean
-                delta_pct = None
-                if baseline_mean != 0:
-                    delta_pct = (delta / abs(baseline_mean)) * 100.0
                 ci_low, ci_high = bootstrap_delta_ci(
                     baseline_values,
                     candidate_values,
                     confidence=thresholds.confidence,
                     samples=thresholds.bootstrap_samples,
-                    rng=rng,
+                    indices=bootstrap_indices,
                 )
                 p_value = permutation_test_p_value(
                     baseline_values,
                     candidate_values,
                     samples=thresholds.permutation_samples,
-                    rng=rng,
+                    permutations=permutations,
+                    early_stop_alpha=thresholds.alpha if thresholds.permutation_early_stop else None,
                 )
-                effect_size = cohens_d(candidate_values, baseline_values)
                 significant = p_value <= thresholds.alpha
-                effect_ok = abs(effect_size) >= thresholds.min_effect_size
-
-                regression_flag, reason = _flag_regression(
-                    metric=metric,
-                    delta=delta,
-                    delta_pct=delta_pct,
-                    significant=significant,
-                    effect_ok=effect_ok,
-                    thresholds=thresholds,
-                )
-                comparison = {
+
+            regression_flag, reason = _flag_regression(
+                metric=metric,
+                delta=delta,
+                delta_pct=delta_pct,
+                significant=significant,
+                effect_ok=effect_ok,
+                thresholds=thresholds,
+            )
+            comparisons.append(
+                {
                     "task_id": task_id,
                     "model": model,
                     "judge": judge,
@@ -110,32 +174,19 @@ def build_regression_report(
                     "candidate_mean": round(candidate_mean, 6),
                     "delta": round(delta, 6),
                     "delta_pct": round(delta_pct, 6) if delta_pct is not None else None,
-                    "ci_low": round(ci_low, 6),
-                    "ci_high": round(ci_high, 6),
-                    "p_value": round(p_value, 6),
+                    "ci_low": round(ci_low, 6) if ci_low is not None else None,
+                    "ci_high": round(ci_high, 6) if ci_high is not None else None,
+                    "p_value": round(p_value, 6) if p_value is not None else None,
                     "effect_size": round(effect_size, 6),
                     "significant": significant,
+                    "screened": screened,
                     "regression": regression_flag,
                     "reason": reason,
                     "n_baseline": len(baseline_values),
                     "n_candidate": len(candidate_values),
                 }
-                comparisons.append(comparison)
-                if regression_flag:
-                    regressions.append(comparison)
-
-    report = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "baseline_mode": baseline_mode,
-        "thresholds": asdict(thresholds),
-        "total_records": len(results),
-        "comparison_count": len(comparisons),
-        "regression_count": len(regressions),
-        "passed": len(regressions) == 0,
-        "comparisons": comparisons,
-        "regressions": regressions,
-    }
-    return report
+            )
+    return comparisons
 
 
 def write_regression_report(
@@ -147,86 +198,194 @@ def write_regression_report(
     output_dir.mkdir(parents=True, exist_ok=True)
     json_output = json_path or (output_dir / "regression_report.json")
     json_output.parent.mkdir(parents=True, exist_ok=True)
-    json_output.write_text(json.dumps(report, indent=2))
+    # json.dump emits many small fragments; a 1 MiB buffer turns them into a
+    # handful of write() calls for large comparison matrices.
+    with json_output.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        json.dump(report, fh, indent=2)
 
     md_output = json_output.with_suffix(".md")
-    md_output.write_text(_render_regression_markdown(report))
+    md_output.write_text(_render_regression_markdown(report), encoding="utf-8")
     return {"regression_json": json_output, "regression_markdown": md_output}
 
 
 def bootstrap_delta_ci(
-    baseline_values: Sequence[float],
-    candidate_values: Sequence[float],
+    baseline_values: ArrayLike,
+    candidate_values: ArrayLike,
     *,
     confidence: float,
     samples: int,
-    rng: random.Random,
+    rng: np.random.Generator | None = None,
+    indices: Tuple[np.ndarray, np.ndarray] | None = None,
 ) -> Tuple[float, float]:
-    if not baseline_values or not candidate_values:
+    """Percentile bootstrap CI for ``mean(candidate) - mean(baseline)``.
+
+    Resample indices come from ``indices`` (``(samples, n)`` matrices for each
+    side, as drawn by ``_bootstrap_indices``) or are drawn from ``rng``.
+    """
+    baseline = np.asarray(baseline_values, dtype=np.float64)
+    candidate = np.asarray(candidate_values, dtype=np.float64)
+    if baseline.size == 0 or candidate.size == 0:
         return (0.0, 0.0)
     if samples <= 1:
-        delta = fmean(candidate_values) - fmean(baseline_values)
+        delta = float(candidate.mean() - baseline.mean())
         return (delta, delta)
-    diffs: List[float] = []
-    for _ in range(samples):
-        sample_base = [baseline_values[rng.randrange(len(baseline_values))] for _ in baseline_values]
-        sample_candidate = [
-            candidate_values[rng.randrange(len(candidate_values))] for _ in candidate_values
-        ]
-        diffs.append(fmean(sample_candidate) - fmean(sample_base))
+    if indices is None:
+        if rng is None:
+            raise ValueError("bootstrap_delta_ci needs either rng or indices.")
+        indices = _bootstrap_indices(rng, baseline.size, candidate.size, samples)
+    baseline_idx, candidate_idx = indices
+    diffs = candidate[candidate_idx].mean(axis=1) - baseline[baseline_idx].mean(axis=1)
     diffs.sort()
     tail = (1.0 - confidence) / 2.0
     low_index = max(0, min(samples - 1, int(tail * samples)))
     high_index = max(0, min(samples - 1, int((1.0 - tail) * samples) - 1))
-    return diffs[low_index], diffs[high_index]
+    return float(diffs[low_index]), float(diffs[high_index])
+
+
+PERMUTATION_BLOCK = 32
+# Permutations evaluated per chunk when not early-stopping; bounds the gathered
+# (rows, n_baseline) scratch array so it stays cache-resident for large samples.
+PERMUTATION_CHUNK = 64
+# Wilson score z for the early-stop interval (~99.7% two-sided), kept wide so a
+# stopped test almost never lands on the other side of alpha than a full run.
+EARLY_STOP_Z = 3.0
+# Relative slack (scaled by the largest |value|) when comparing permuted deltas to
+# the observed one: far above summation rounding, far below any real difference.
+TIE_RTOL = 1e-12
 
 
 def permutation_test_p_value(
-    baseline_values: Sequence[float],
-    candidate_values: Sequence[float],
+    baseline_values: ArrayLike,
+    candidate_values: ArrayLike,
     *,
     samples: int,
-    rng: random.Random,
+    rng: np.random.Generator | None = None,
+    permutations: np.ndarray | None = None,
+    early_stop_alpha: float | None = None,
 ) -> float:
-    if not baseline_values or not candidate_values:
+    """Two-sided permutation p-value for the difference in means.
+
+    Shuffles come from ``permutations`` (a ``(samples, N)`` matrix of pooled-sample
+    indices, as drawn by ``_permutation_indices``) or are drawn from ``rng``. With
+    ``early_stop_alpha`` set, permutations are evaluated in blocks and the test
+    stops once a Wilson interval on the running p-value lies clearly above or
+    below that alpha.
+    """
+    baseline = np.asarray(baseline_values, dtype=np.float64)
+    candidate = np.asarray(candidate_values, dtype=np.float64)
+    if baseline.size == 0 or candidate.size == 0:
         return 1.0
-    observed = abs(fmean(candidate_values) - fmean(baseline_values))
-    merged = list(baseline_values) + list(candidate_values)
-    base_size = len(baseline_values)
+    base_size = baseline.size
+    candidate_size = candidate.size
+    # The observed delta uses the same (total - s) / n_c - s / n_b arithmetic as the
+    # permuted deltas below, so the identity split reproduces it exactly.
+    base_total = baseline.sum()
+    total = base_total + candidate.sum()
+    observed = abs((total - base_total) / candidate_size - base_total / base_size)
     if samples <= 1:
         return 1.0
+    # Permuted deltas are rebuilt from reordered sums, so a split that exactly ties
+    # the observed one can land an ulp or two below it; count those as extreme.
+    tolerance = TIE_RTOL * float(max(np.abs(baseline).max(), np.abs(candidate).max()))
+    if observed <= tolerance:
+        # Every permuted |delta| is >= 0, so the full test would count all samples.
+        return 1.0
+    # Built once per call and only gathered from; the permutations themselves are
+    # index matrices, so the pooled values are never shuffled in place.
+    merged = np.concatenate([baseline, candidate])
+
+    # Rows are shuffled in order, so drawing blocks from ``rng`` consumes the stream
+    # exactly like one full draw; a test that never stops matches the plain result.
+    step = PERMUTATION_CHUNK if early_stop_alpha is None else PERMUTATION_BLOCK
     extreme = 0
-    for _ in range(samples):
-        rng.shuffle(merged)
-        perm_base = merged[:base_size]
-        perm_candidate = merged[base_size:]
-        perm_delta = abs(fmean(perm_candidate) - fmean(perm_base))
-        if perm_delta >= observed:
-            extreme += 1
-    return (extreme + 1) / (samples + 1)
-
-
-def cohens_d(sample_a: Sequence[float], sample_b: Sequence[float]) -> float:
-    if not sample_a or not sample_b:
+    done = 0
+    while done < samples:
+        rows = min(step, samples - done)
+        if permutations is not None:
+            block = permutations[done : done + rows]
+        elif rng is not None:
+            block = _permutation_indices(rng, merged.size, rows)
+        else:
+            raise ValueError("permutation_test_p_value needs either rng or permutations.")
+        # Only the baseline slice is summed; the candidate sum follows from the total.
+        base_sums = merged[block[:, :base_size]].sum(axis=1)
+        perm_delta = np.abs((total - base_sums) / candidate_size - base_sums / base_size)
+        extreme += int(np.count_nonzero(perm_delta >= observed - tolerance))
+        done += rows
+        if early_stop_alpha is not None:
+            low, high = _wilson_interval(extreme, done, EARLY_STOP_Z)
+            if high < early_stop_alpha or low > early_stop_alpha:
+                break
+    return (extreme + 1) / (done + 1)
+
+
+def _bootstrap_indices(
+    rng: np.random.Generator, baseline_size: int, candidate_size: int, samples: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    return (
+        rng.integers(0, baseline_size, size=(samples, baseline_size), dtype=np.int32),
+        rng.integers(0, candidate_size, size=(samples, candidate_size), dtype=np.int32),
+    )
+
+
+def _permutation_indices(rng: np.random.Generator, size: int, samples: int) -> np.ndarray:
+    # Each row is an independent shuffle of the pooled-sample positions. Indices are
+    # int32 to halve the matrix; values stay float64 because rule scores tie often
+    # and float32 rounding would flip ``perm_delta >= observed`` on exact ties.
+    return rng.permuted(np.broadcast_to(np.arange(size, dtype=np.int32), (samples, size)), axis=1)
+
+
+class _SharedDraws:
+    """Bootstrap and permutation indices for one comparison, keyed by sample sizes."""
+
+    def __init__(self, rng: np.random.Generator, thresholds: RegressionThresholds):
+        self._rng = rng
+        self._thresholds = thresholds
+        self._draws: Dict[Tuple[int, int], Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]] = {}
+
+    def get(self, baseline_size: int, candidate_size: int) -> Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]:
+        key = (baseline_size, candidate_size)
+        if key not in self._draws:
+            bootstrap_samples = max(1, self._thresholds.bootstrap_samples)
+            permutation_samples = max(1, self._thresholds.permutation_samples)
+            self._draws[key] = (
+                _bootstrap_indices(self._rng, baseline_size, candidate_size, bootstrap_samples),
+                _permutation_indices(self._rng, baseline_size + candidate_size, permutation_samples),
+            )
+        return self._draws[key]
+
+
+def _wilson_interval(successes: int, trials: int, z: float) -> Tuple[float, float]:
+    proportion = successes / trials
+    z2 = z * z
+    denom = 1.0 + z2 / trials
+    centre = (proportion + z2 / (2 * trials)) / denom
+    margin = z * math.sqrt(proportion * (1 - proportion) / trials + z2 / (4 * trials * trials)) / denom
+    return centre - margin, centre + margin
+
+
+def cohens_d(sample_a: ArrayLike, sample_b: ArrayLike) -> float:
+    a = np.asarray(sample_a, dtype=np.float64)
+    b = np.asarray(sample_b, dtype=np.float64)
+    if a.size == 0 or b.size == 0:
         return 0.0
-    mean_a = fmean(sample_a)
-    mean_b = fmean(sample_b)
-    var_a = _sample_variance(sample_a)
-    var_b = _sample_variance(sample_b)
-    pooled_denom = len(sample_a) + len(sample_b) - 2
+    pooled_denom = a.size + b.size - 2
     if pooled_denom <= 0:
         return 0.0
-    pooled_var = ((len(sample_a) - 1) * var_a + (len(sample_b) - 1) * var_b) / pooled_denom
+    # A single observation contributes no variance (its ddof=1 variance is undefined).
+    sum_sq_a = a.var(ddof=1) * (a.size - 1) if a.size > 1 else 0.0
+    sum_sq_b = b.var(ddof=1) * (b.size - 1) if b.size > 1 else 0.0
+    pooled_var = (sum_sq_a + sum_sq_b) / pooled_denom
     if pooled_var <= 0:
         return 0.0
-    return (mean_a - mean_b) / math.sqrt(pooled_var)
+    return float((a.mean() - b.mean()) / math.sqrt(pooled_var))
 
 
-def _sample_variance(values: Sequence[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    mean_value = fmean(values)
-    return sum((value - mean_value) ** 2 for value in values) / (len(values) - 1)
+_REGRESSION_REASONS = {
+    "latency_ms": "Latency regression exceeds threshold",
+    "cost_usd": "Cost regression exceeds threshold",
+    "rule_score": "Rule score regression exceeds threshold",
+}
 
 
 def _flag_regression(
@@ -238,34 +397,30 @@ def _flag_regression(
     effect_ok: bool,
     thresholds: RegressionThresholds,
 ) -> Tuple[bool, str]:
-    if metric == "latency_ms":
-        if (
-            delta_pct is not None
-            and delta_pct >= thresholds.latency_regression_pct
-            and significant
-            and effect_ok
-        ):
-            return True, "Latency regression exceeds threshold"
-        return False, ""
+    if _exceeds_threshold(metric=metric, delta=delta, delta_pct=delta_pct, thresholds=thresholds):
+        if significant and effect_ok:
+            return True, _REGRESSION_REASONS[metric]
+    return False, ""
 
-    if metric == "cost_usd":
-        if (
-            delta_pct is not None
-            and delta_pct >= thresholds.cost_regression_pct
-            and significant
-            and effect_ok
-        ):
-            return True, "Cost regression exceeds threshold"
-        return False, ""
 
+def _exceeds_threshold(
+    *,
+    metric: str,
+    delta: float,
+    delta_pct: float | None,
+    thresholds: RegressionThresholds,
+) -> bool:
+    """Whether the raw delta crosses the metric's gate threshold, before any statistics."""
+    if metric == "latency_ms":
+        return delta_pct is not None and delta_pct >= thresholds.latency_regression_pct
+    if metric == "cost_usd":
+        return delta_pct is not None and delta_pct >= thresholds.cost_regression_pct
     if metric == "rule_score":
-        if delta <= -thresholds.rule_score_drop and significant and effect_ok:
-            return True, "Rule score regression exceeds threshold"
-        return False, ""
-
-    return False, ""
+        return delta <= -thresholds.rule_score_drop
+    return False
 
 
+@lru_cache(maxsize=4096)
 def _stable_seed(key: str) -> int:
     digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
     return int(digest[:8], 16)
@@ -319,7 +474,7 @@ def _render_regression_markdown(report: Dict) -> str:
                 ]
             )
         lines.append("## Flagged Regressions")
-        lines.append(tabulate(rows, headers=headers, tablefmt="github"))
+        lines.append(render_github_table(headers, rows))
         lines.append("")
     else:
         lines.append("## Flagged Regressions")
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import csv
+import io
+import math
+import os
+import re
 import shutil
-from collections import defaultdict
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from statistics import mean
-from typing import Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
-from tabulate import tabulate
-import matplotlib.pyplot as plt
+import numpy as np
 
+from .tables import render_github_table
 
-def generate_reports(results: List[Dict], output_dir: str | Path) -> Dict[str, Path]:
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Charts are report thumbnails: 100 dpi gives 400x300 px PNGs, and fast zlib
+# compression keeps savefig from dominating chart time. PNG output stays lossless.
+CHART_DPI = 100
+_PNG_SAVE_OPTIONS = {"optimize": False, "compress_level": 1}
+# Drop the "Software: matplotlib version ..." text chunk so chart bytes do not
+# change with the installed matplotlib version.
+_PNG_METADATA = {"Software": None}
+
+
+def generate_reports(
+    results: List[Dict],
+    output_dir: str | Path,
+    *,
+    chart_dpi: int = CHART_DPI,
+    chart_workers: int = 1,
+) -> Dict[str, Path]:
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
@@ -24,34 +49,47 @@ def generate_reports(results: List[Dict], output_dir: str | Path) -> Dict[str, P
     }
 
     _write_csv(results, csv_path)
-    aggregates = aggregate_by_mode(results)
-    task_aggregates = aggregate_by_task_mode(results)
-    mode_deltas = compute_mode_deltas(aggregates)
-    task_deltas = compute_task_deltas(task_aggregates)
+    # Results are materialised once; aggregation and the task charts both read
+    # the same metric matrix instead of re-walking the row dicts.
+    arrays = _ResultArrays(results)
+    aggregates = _aggregate_modes(arrays)
+    task_aggregates = _aggregate_task_modes(arrays)
+    # Every table lists modes and tasks alphabetically; sort once and hand the
+    # ordered rows to each writer.
+    sorted_modes = sorted(aggregates.items())
+    sorted_mode_deltas = sorted(compute_mode_deltas(aggregates).items())
+    sorted_tasks = _sort_nested(task_aggregates)
+    sorted_task_deltas = _sort_nested(compute_task_deltas(task_aggregates))
     aggregate_csv_path = output_path / "aggregates_by_mode.csv"
     mode_delta_csv_path = output_path / "deltas_by_mode.csv"
     task_aggregate_csv_path = output_path / "aggregates_by_task.csv"
-    _write_aggregates_csv(aggregates, aggregate_csv_path)
-    _write_task_aggregates_csv(task_aggregates, task_aggregate_csv_path)
-    _write_mode_deltas_csv(mode_deltas, mode_delta_csv_path)
-    create_charts(aggregates, chart_paths)
-    task_chart_paths = create_task_charts(results, output_path)
+    _write_aggregates_csv(sorted_modes, aggregate_csv_path)
+    _write_task_aggregates_csv(sorted_tasks, task_aggregate_csv_path)
+    _write_mode_deltas_csv(sorted_mode_deltas, mode_delta_csv_path)
+    create_charts(aggregates, chart_paths, dpi=chart_dpi)
+    task_chart_paths = _create_task_charts(arrays, output_path, max_workers=chart_workers, dpi=chart_dpi)
+    # Stat each chart once; the Markdown and HTML writers only check membership.
+    existing_charts = {path for path in (*chart_paths.values(), *task_chart_paths.values()) if path.exists()}
     _write_markdown(
         md_path,
-        aggregates,
-        mode_deltas,
-        task_deltas,
+        sorted_modes,
+        sorted_mode_deltas,
+        sorted_task_deltas,
         chart_paths,
         task_chart_paths,
+        existing_charts,
         results,
     )
     html_paths = _write_html_report(
         results,
         aggregates,
-        mode_deltas,
-        task_deltas,
+        sorted_modes,
+        sorted_tasks,
+        sorted_mode_deltas,
+        sorted_task_deltas,
         chart_paths,
         task_chart_paths,
+        existing_charts,
         output_path,
     )
 
@@ -61,137 +99,289 @@ def generate_reports(results: List[Dict], output_dir: str | Path) -> Dict[str, P
         "aggregates_csv": aggregate_csv_path,
         "deltas_csv": mode_delta_csv_path,
         "task_aggregates_csv": task_aggregate_csv_path,
-        **chart_paths,
+        **(chart_paths if aggregates else {}),
         **task_chart_paths,
         **html_paths,
     }
 
 
+ModeRows = Sequence[Tuple[str, Dict[str, float]]]
+TaskRows = Sequence[Tuple[str, ModeRows]]
+
+
+def _sort_nested(task_map: Dict[str, Dict[str, Dict[str, float]]]) -> List[Tuple[str, ModeRows]]:
+    return [(task_id, sorted(modes.items())) for task_id, modes in sorted(task_map.items())]
+
+
 def _write_csv(results: List[Dict], path: Path) -> None:
     if not results:
         path.write_text("")
         return
     fieldnames = sorted({key for row in results for key in row.keys()})
-    with path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+    _write_csv_rows(path, fieldnames, [[row.get(field, "") for field in fieldnames] for row in results])
 
 
-def _write_aggregates_csv(aggregates: Dict[str, Dict[str, float]], path: Path) -> None:
+def _write_aggregates_csv(aggregates: ModeRows, path: Path) -> None:
     if not aggregates:
         path.write_text("")
         return
-    headers = sorted({metric for metrics in aggregates.values() for metric in metrics.keys()})
-    headers = ["mode"] + headers
-    with path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-        for mode, metrics in sorted(aggregates.items()):
-            row: Dict[str, float | str] = {"mode": mode}
-            row.update(metrics)
-            writer.writerow(row)
-
-
-def _write_mode_deltas_csv(mode_deltas: Dict[str, Dict[str, float]], path: Path) -> None:
+    metrics_order = sorted({metric for _, metrics in aggregates for metric in metrics.keys()})
+    rows = [[mode, *(metrics.get(metric, "") for metric in metrics_order)] for mode, metrics in aggregates]
+    _write_csv_rows(path, ["mode", *metrics_order], rows)
+
+
+def _write_mode_deltas_csv(mode_deltas: ModeRows, path: Path) -> None:
     if not mode_deltas:
         path.write_text("")
         return
-    headers = sorted({metric for metrics in mode_deltas.values() for metric in metrics.keys()})
-    headers = ["mode"] + headers
-    with path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-        for mode, metrics in sorted(mode_deltas.items()):
-            row: Dict[str, float | str] = {"mode": mode}
-            row.update(metrics)
-            writer.writerow(row)
+    metrics_order = sorted({metric for _, metrics in mode_deltas for metric in metrics.keys()})
+    rows = [[mode, *(metrics.get(metric, "") for metric in metrics_order)] for mode, metrics in mode_deltas]
+    _write_csv_rows(path, ["mode", *metrics_order], rows)
 
 
 def _write_task_aggregates_csv(
-    task_aggregates: Dict[str, Dict[str, Dict[str, float]]],
+    task_aggregates: TaskRows,
     path: Path,
 ) -> None:
     if not task_aggregates:
         path.write_text("")
         return
-    headers = sorted(
-        {metric for modes in task_aggregates.values() for metrics in modes.values() for metric in metrics.keys()}
+    metrics_order = sorted(
+        {metric for _, modes in task_aggregates for _, metrics in modes for metric in metrics.keys()}
     )
-    headers = ["task_id", "mode"] + headers
-    with path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-        for task_id, modes in sorted(task_aggregates.items()):
-            for mode, metrics in sorted(modes.items()):
-                row: Dict[str, float | str] = {"task_id": task_id, "mode": mode}
-                row.update(metrics)
-                writer.writerow(row)
+    rows = [
+        [task_id, mode, *(metrics.get(metric, "") for metric in metrics_order)]
+        for task_id, modes in task_aggregates
+        for mode, metrics in modes
+    ]
+    _write_csv_rows(path, ["task_id", "mode", *metrics_order], rows)
 
 
-def aggregate_by_mode(results: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
-    buckets: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
-    for row in results:
-        mode = row["mode"]
-        buckets[mode]["latency_ms"].append(row.get("latency_ms", 0.0))
-        if row.get("tokens_in") is not None:
-            buckets[mode]["tokens_in"].append(row["tokens_in"])
-        if row.get("tokens_out") is not None:
-            buckets[mode]["tokens_out"].append(row["tokens_out"])
-        buckets[mode]["rule_score"].append(row.get("rule_score", 0.0))
-        if row.get("llm_score") is not None:
-            buckets[mode]["llm_score"].append(row["llm_score"])
-        if row.get("cost_usd") is not None:
-            buckets[mode]["cost_usd"].append(row["cost_usd"])
-
-    aggregates: Dict[str, Dict[str, float]] = {}
-    for mode, metrics in buckets.items():
-        aggregates[mode] = {}
-        for metric, values in metrics.items():
-            if not values:
+def _write_utf8(path: Path, text: str) -> None:
+    # Reports are assembled in memory, so each file is one encode and one write
+    # with no text-layer buffering or newline translation in between.
+    path.write_bytes(text.encode("utf-8"))
+
+
+# Characters that make csv.writer quote a field under the default QUOTE_MINIMAL.
+_CSV_NEEDS_QUOTING = re.compile(r'[",\r\n]')
+
+
+def _write_csv_rows(path: Path, headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    # Rows are pre-ordered lists, so csv.writer skips DictWriter's per-row
+    # dict-to-list conversion; the file is written in a single call.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if _CSV_NEEDS_QUOTING.search("".join(headers)):
+        writer.writerow(headers)
+    else:
+        # Plain identifier headers need no quoting, so skip the writer's escaping.
+        buffer.write(",".join(headers) + writer.dialect.lineterminator)
+    writer.writerows(rows)
+    _write_utf8(path, buffer.getvalue())
+
+
+# Column order of the metric matrix built by ``_ResultArrays``. Missing values are
+# NaN (latency defaults to 0.0) and are skipped when averaging. The matrix carries
+# one more column per metric flagging values that were Python ints, so means of
+# whole-number inputs keep ``statistics.mean``'s int result.
+_AGGREGATE_METRICS = ("latency_ms", "tokens_in", "tokens_out", "rule_score", "llm_score", "cost_usd")
+_RULE_SCORE_COLUMN = _AGGREGATE_METRICS.index("rule_score")
+
+
+class _ResultArrays:
+    """Results materialised once as a float64 metric matrix plus integer group ids."""
+
+    def __init__(self, results: Iterable[Dict]):
+        mode_index: Dict[str, int] = {}
+        task_index: Dict[str, int] = {}
+        chart_task_index: Dict[str, int] = {}
+        mode_ids: List[int] = []
+        task_ids: List[int] = []
+        chart_task_ids: List[int] = []
+        rows: List[List[float]] = []
+        nan = float("nan")
+        for row in results:
+            mode_ids.append(mode_index.setdefault(row["mode"], len(mode_index)))
+            task_id = row.get("task_id") or row.get("task")
+            task_ids.append(task_index.setdefault(task_id, len(task_index)) if task_id else -1)
+            # Charts fall back to the task file path when a task has no id.
+            chart_task = row.get("task_id") or row.get("task_path")
+            chart_task_ids.append(
+                chart_task_index.setdefault(chart_task, len(chart_task_index)) if chart_task else -1
+            )
+            values = []
+            integral = []
+            for metric in _AGGREGATE_METRICS:
+                value = row.get(metric, 0.0 if metric == "latency_ms" else None)
+                values.append(nan if value is None else value)
+                integral.append(1.0 if isinstance(value, int) else 0.0)
+            rows.append(values + integral)
+        self.modes = list(mode_index)
+        self.tasks = list(task_index)
+        self.chart_tasks = list(chart_task_index)
+        self.mode_ids = np.asarray(mode_ids, dtype=np.int32)
+        self.task_ids = np.asarray(task_ids, dtype=np.int32)
+        self.chart_task_ids = np.asarray(chart_task_ids, dtype=np.int32)
+        self.metrics = np.asarray(rows, dtype=np.float64).reshape(len(rows), 2 * len(_AGGREGATE_METRICS))
+
+
+def _summarise_blocks(blocks: Sequence[np.ndarray], *, default_rule_score: bool = False) -> List[Dict[str, float]]:
+    """Summarise every group's metric block with one set of array reductions.
+
+    Means come from ``_rounded_mean`` per group and metric column, and the
+    latency percentiles from a single lexsort by (group, latency).
+    """
+    if not blocks:
+        return []
+    lengths = np.fromiter((len(block) for block in blocks), dtype=np.intp, count=len(blocks))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    stacked = np.concatenate(blocks)
+    values = stacked[:, : len(_AGGREGATE_METRICS)]
+    if default_rule_score:
+        # Per-mode aggregates count a missing rule score as 0.0.
+        column = values[:, _RULE_SCORE_COLUMN]
+        column[np.isnan(column)] = 0.0
+    present = ~np.isnan(values)
+    counts = np.add.reduceat(present.astype(np.intp), starts, axis=0)
+    int_counts = np.add.reduceat(stacked[:, len(_AGGREGATE_METRICS) :].astype(np.intp), starts, axis=0)
+
+    # NaN latencies sort to the end of their group, after its `valid` values.
+    latency = values[:, 0]
+    sorted_latency = latency[np.lexsort((latency, np.repeat(np.arange(len(blocks)), lengths)))]
+    valid = counts[:, 0]
+    p50 = _linear_quantile(sorted_latency, starts, valid, 0.5)
+    p95 = _linear_quantile(sorted_latency, starts, valid, 0.95)
+
+    summaries: List[Dict[str, float]] = []
+    groups = zip(np.split(values, starts[1:]), np.split(present, starts[1:]))
+    for group, (block, block_present) in enumerate(groups):
+        summary: Dict[str, float] = {}
+        for column, metric in enumerate(_AGGREGATE_METRICS):
+            count = counts[group, column]
+            if not count:
                 continue
-            aggregates[mode][metric] = round(mean(values), 4)
-        latencies = metrics.get("latency_ms", [])
-        p50 = _percentile(latencies, 50)
-        p95 = _percentile(latencies, 95)
-        if p50 is not None:
-            aggregates[mode]["latency_p50"] = round(p50, 4)
-        if p95 is not None:
-            aggregates[mode]["latency_p95"] = round(p95, 4)
-    return aggregates
+            column_values = block[block_present[:, column], column].tolist()
+            if int_counts[group, column] == count:
+                whole, remainder = divmod(int(math.fsum(column_values)), int(count))
+                if not remainder:
+                    summary[metric] = whole
+                    continue
+            summary[metric] = _rounded_mean(column_values)
+        if valid[group]:
+            summary["latency_p50"] = round(float(p50[group]), 4)
+            summary["latency_p95"] = round(float(p95[group]), 4)
+        summaries.append(summary)
+    return summaries
+
+
+# ulps either side of an fsum-based mean that could still hold the exact mean:
+# one rounding in fsum plus one in the division, with a little margin.
+_MEAN_ULP_WINDOW = 4
+
+
+def _rounded_mean(values: List[float], digits: int = 4) -> float:
+    """``round(statistics.mean(values), digits)`` without exact arithmetic in the common case.
+
+    ``math.fsum`` / ``len`` lands within a few ulps of the exact mean; only when
+    that window straddles a rounding boundary does ``statistics.mean`` decide.
+    """
+    approx = math.fsum(values) / len(values)
+    low = high = approx
+    for _ in range(_MEAN_ULP_WINDOW):
+        low = math.nextafter(low, -math.inf)
+        high = math.nextafter(high, math.inf)
+    rounded = round(approx, digits)
+    if round(low, digits) == rounded == round(high, digits):
+        return rounded
+    return round(statistics.mean(values), digits)
+
+
+def _linear_quantile(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """Per-group ``np.percentile(..., method="linear")`` over sorted, contiguous groups.
+
+    Index and interpolation arithmetic follow NumPy's implementation step for
+    step so results match ``np.percentile`` bit for bit.
+    """
+    virtual = (counts - 1) * q
+    previous = np.floor(virtual).astype(np.intp)
+    following = previous + 1
+    last = np.maximum(counts - 1, 0)
+    above = virtual >= counts - 1
+    previous[above] = last[above]
+    following[above] = last[above]
+    below = virtual < 0
+    previous[below] = 0
+    following[below] = 0
+    gamma = virtual - previous
+    lower = sorted_values[starts + previous]
+    upper = sorted_values[starts + following]
+    diff = upper - lower
+    return np.where(gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma)
+
+
+def aggregate_all(
+    results: Iterable[Dict],
+) -> tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, Dict[str, float]]]]:
+    """Return ``(aggregate_by_mode, aggregate_by_task_mode)`` from one pass over ``results``."""
+    arrays = _ResultArrays(results)
+    return _aggregate_modes(arrays), _aggregate_task_modes(arrays)
+
+
+def aggregate_by_mode(results: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
+    return _aggregate_modes(_ResultArrays(results))
+
+
+def _aggregate_modes(arrays: _ResultArrays) -> Dict[str, Dict[str, float]]:
+    # Mode ids are assigned in first-appearance order, so ascending ids keep it.
+    groups = _group_blocks(arrays.mode_ids, arrays.metrics)
+    summaries = _summarise_blocks([block for _, _, block in groups], default_rule_score=True)
+    return {arrays.modes[mode_id]: summary for (mode_id, _, _), summary in zip(groups, summaries)}
 
 
 def aggregate_by_task_mode(results: Iterable[Dict]) -> Dict[str, Dict[str, Dict[str, float]]]:
-    buckets: Dict[str, Dict[str, Dict[str, List[float]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-    for row in results:
-        task_id = row.get("task_id") or row.get("task")
-        if not task_id:
-            continue
-        mode = row["mode"]
-        buckets[task_id][mode]["latency_ms"].append(row.get("latency_ms", 0.0))
-        for metric in ("tokens_in", "tokens_out", "rule_score", "llm_score", "cost_usd"):
-            value = row.get(metric)
-            if value is not None:
-                buckets[task_id][mode][metric].append(value)
+    return _aggregate_task_modes(_ResultArrays(results))
 
+
+def _aggregate_task_modes(arrays: _ResultArrays) -> Dict[str, Dict[str, Dict[str, float]]]:
+    groups = _task_mode_blocks(arrays, arrays.task_ids)
+    summaries = _summarise_blocks([block for _, _, block in groups])
     aggregates: Dict[str, Dict[str, Dict[str, float]]] = {}
-    for task_id, mode_map in buckets.items():
-        aggregates[task_id] = {}
-        for mode, metrics in mode_map.items():
-            aggregates[task_id][mode] = {}
-            for metric, values in metrics.items():
-                if values:
-                    aggregates[task_id][mode][metric] = round(mean(values), 4)
-            latencies = buckets[task_id][mode].get("latency_ms", [])
-            p50 = _percentile(latencies, 50)
-            p95 = _percentile(latencies, 95)
-            if p50 is not None:
-                aggregates[task_id][mode]["latency_p50"] = round(p50, 4)
-            if p95 is not None:
-                aggregates[task_id][mode]["latency_p95"] = round(p95, 4)
+    for (task_id_index, mode_id, _), summary in zip(groups, summaries):
+        aggregates.setdefault(arrays.tasks[task_id_index], {})[arrays.modes[mode_id]] = summary
     return aggregates
 
 
+def _task_mode_blocks(arrays: _ResultArrays, task_ids: np.ndarray) -> List[Tuple[int, int, np.ndarray]]:
+    """Return ``(task index, mode id, block)`` for rows with a task, ordered by first appearance."""
+    in_task = task_ids >= 0
+    mode_count = max(len(arrays.modes), 1)
+    keys = task_ids[in_task].astype(np.int64) * mode_count + arrays.mode_ids[in_task]
+    groups = _group_blocks(keys, arrays.metrics[in_task])
+    # Tasks keep first-appearance order, and so do modes within each task.
+    groups.sort(key=lambda group: (group[0] // mode_count, group[1]))
+    return [(*divmod(key, mode_count), block) for key, _, block in groups]
+
+
+def _group_blocks(keys: np.ndarray, metrics: np.ndarray) -> List[Tuple[int, int, np.ndarray]]:
+    """Split ``metrics`` rows into contiguous per-key blocks with one stable sort.
+
+    Returns ``(key, first_row, block)`` tuples in ascending key order, where
+    ``first_row`` is the position of the key's first row in the input.
+    """
+    if not keys.size:
+        return []
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_metrics = metrics[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    ends = np.append(starts[1:], keys.size)
+    return [
+        (int(sorted_keys[start]), int(order[start]), sorted_metrics[start:end])
+        for start, end in zip(starts, ends)
+    ]
+
+
 def compute_mode_deltas(aggregates: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
     baseline = aggregates.get("baseline")
     if not baseline:
@@ -200,12 +390,7 @@ def compute_mode_deltas(aggregates: Dict[str, Dict[str, float]]) -> Dict[str, Di
     for mode, metrics in aggregates.items():
         if mode == "baseline":
             continue
-        diff: Dict[str, float] = {}
-        for metric, value in metrics.items():
-            base_value = baseline.get(metric)
-            if base_value is None:
-                continue
-            diff[metric] = round(value - base_value, 4)
+        diff = _metric_deltas(metrics, baseline)
         if diff:
             deltas[mode] = diff
     return deltas
@@ -220,212 +405,312 @@ def compute_task_deltas(task_aggregates: Dict[str, Dict[str, Dict[str, float]]])
         for mode, metrics in modes.items():
             if mode == "baseline":
                 continue
-            diff: Dict[str, float] = {}
-            for metric, value in metrics.items():
-                base_value = baseline.get(metric)
-                if base_value is None:
-                    continue
-                diff[metric] = round(value - base_value, 4)
+            diff = _metric_deltas(metrics, baseline)
             if diff:
                 deltas.setdefault(task_id, {})[mode] = diff
     return deltas
 
 
-def create_charts(aggregates: Dict[str, Dict[str, float]], chart_paths: Dict[str, Path]) -> None:
+def _metric_deltas(metrics: Dict[str, float], baseline: Dict[str, float]) -> Dict[str, float]:
+    """Rounded ``metric - baseline`` for every metric both sides recorded, in ``metrics`` order."""
+    return {
+        metric: round(value - base_value, 4)
+        for metric, value in metrics.items()
+        if (base_value := baseline.get(metric)) is not None
+    }
+
+
+def create_charts(
+    aggregates: Dict[str, Dict[str, float]],
+    chart_paths: Dict[str, Path],
+    *,
+    dpi: int = CHART_DPI,
+) -> None:
     if not aggregates:
-        for path in chart_paths.values():
-            path.write_text("")
         return
 
     modes = list(aggregates.keys())
 
+    # One figure is cleared and redrawn for each chart instead of allocating a
+    # new figure and Agg buffer per PNG.
+    fig, ax = _new_figure()
     latency_values = [aggregates[mode].get("latency_ms", 0.0) for mode in modes]
     _bar_chart(
+        fig,
+        ax,
         modes,
         latency_values,
         ylabel="Avg latency (ms)",
         title="Latency by mode",
         path=chart_paths["latency"],
+        dpi=dpi,
     )
 
     rule_values = [aggregates[mode].get("rule_score", 0.0) for mode in modes]
     _bar_chart(
+        fig,
+        ax,
         modes,
         rule_values,
         ylabel="Avg rule score",
         title="Rule-based quality by mode",
         path=chart_paths["rule_score"],
         ylim=(0, 1),
+        dpi=dpi,
     )
 
 
-def create_task_charts(results: List[Dict], output_path: Path) -> Dict[str, Path]:
-    by_task: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
-    for row in results:
-        task_id = row.get("task_id") or row.get("task_path")
-        if not task_id:
-            continue
-        by_task[task_id][row["mode"]].append(row.get("latency_ms", 0.0))
-
-    chart_paths: Dict[str, Path] = {}
-    for task_id, modes in by_task.items():
-        fig, ax = plt.subplots(figsize=(4, 3))
-        has_data = False
-        for mode, latencies in modes.items():
-            if not latencies:
-                continue
-            has_data = True
-            ax.hist(latencies, bins=min(5, len(latencies)), alpha=0.6, label=mode)
-        if not has_data:
-            plt.close(fig)
-            continue
-        ax.set_title(f"Latency distribution — {task_id}")
-        ax.set_xlabel("Latency (ms)")
-        ax.set_ylabel("Count")
-        ax.legend()
-        fig.tight_layout()
-        filename = f"chart_{_sanitize_name(task_id)}_latency.png"
-        path = output_path / filename
-        fig.savefig(path, dpi=150)
-        plt.close(fig)
-        chart_paths[f"{task_id}_latency"] = path
-    return chart_paths
+# Below this many task charts a process pool costs more to start (each worker
+# re-imports matplotlib) than rendering the charts serially on one figure.
+PARALLEL_CHART_MIN_TASKS = 16
+
+
+def create_task_charts(
+    results: List[Dict],
+    output_path: Path,
+    *,
+    max_workers: int = 1,
+    dpi: int = CHART_DPI,
+) -> Dict[str, Path]:
+    """Render one latency histogram per task.
+
+    Charts render serially by default; ``max_workers > 1`` opts into a process
+    pool for large task sets, falling back to serial if the pool cannot run.
+    """
+    return _create_task_charts(_ResultArrays(results), output_path, max_workers=max_workers, dpi=dpi)
+
+
+def _create_task_charts(
+    arrays: _ResultArrays,
+    output_path: Path,
+    *,
+    max_workers: int = 1,
+    dpi: int = CHART_DPI,
+) -> Dict[str, Path]:
+    by_task: Dict[str, Dict[str, np.ndarray]] = {}
+    for task_index, mode_id, block in _task_mode_blocks(arrays, arrays.chart_task_ids):
+        by_task.setdefault(arrays.chart_tasks[task_index], {})[arrays.modes[mode_id]] = block[:, 0]
+
+    if not by_task:
+        return {}
+    # Chart paths are resolved here, once per task, so workers only draw and save.
+    chart_paths = {
+        task_id: output_path / f"chart_{_sanitize_name(task_id)}_latency.png" for task_id in by_task
+    }
+    jobs = [(task_id, modes, chart_paths[task_id], dpi) for task_id, modes in by_task.items()]
+    workers = min(max_workers, len(jobs))
+    pooled = workers > 1 and len(jobs) >= PARALLEL_CHART_MIN_TASKS and _render_in_pool(jobs, workers)
+    if not pooled:
+        fig, ax = _new_figure()
+        for job in jobs:
+            _render_task_hist(*job, figure=(fig, ax))
+    return {f"{task_id}_latency": path for task_id, path in chart_paths.items()}
+
+
+def _render_in_pool(jobs: List[tuple], workers: int) -> bool:
+    """Render ``jobs`` on a process pool; False if the pool could not run them."""
+    try:
+        # Agg figures are independent of pyplot state, so each process renders its
+        # charts without coordination.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_render_task_hist, *zip(*jobs)))
+    except (OSError, BrokenProcessPool):
+        # No process support in this environment, or a worker died.
+        return False
+    return True
+
+
+def _render_task_hist(
+    task_id: str,
+    mode_latencies: Mapping[str, np.ndarray],
+    path: Path,
+    dpi: int = CHART_DPI,
+    *,
+    figure: tuple[Figure, Axes] | None = None,
+) -> None:
+    fig, ax = figure or _new_figure()
+    ax.clear()
+    # Every mode block has at least one latency; grouping never yields empty ones.
+    for mode, latencies in mode_latencies.items():
+        # Bin in NumPy and draw the bins as bars: matplotlib's hist() would copy
+        # and re-coerce every latency before binning.
+        counts, edges = np.histogram(np.asarray(latencies, dtype=np.float64), bins=min(5, len(latencies)))
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", alpha=0.6, label=mode)
+    ax.set_title(f"Latency distribution — {task_id}")
+    ax.set_xlabel("Latency (ms)")
+    ax.set_ylabel("Count")
+    ax.legend()
+    path.write_bytes(_figure_to_png_bytes(fig, dpi=dpi))
+
+
+_REPORT_ASSETS_DIR = Path(__file__).resolve().parent / "report_assets"
+_STATIC_ASSETS = ("style.css", "app.js")
 
 
 def _write_html_report(
     results: List[Dict],
     aggregates: Dict[str, Dict[str, float]],
-    mode_deltas: Dict[str, Dict[str, float]],
-    task_deltas: Dict[str, Dict[str, Dict[str, float]]],
+    sorted_modes: ModeRows,
+    task_aggregates: TaskRows,
+    mode_deltas: ModeRows,
+    task_deltas: TaskRows,
     chart_paths: Dict[str, Path],
     task_chart_paths: Dict[str, Path],
+    existing_charts: Set[Path],
     output_path: Path,
 ) -> Dict[str, Path]:
     html_root = output_path / "html"
     assets_dir = html_root / "assets"
     assets_dir.mkdir(parents=True, exist_ok=True)
 
-    assets_source = Path(__file__).resolve().parent / "report_assets"
-    style_src = assets_source / "style.css"
-    script_src = assets_source / "app.js"
+    for name in _STATIC_ASSETS:
+        # Packaged assets are copied, never linked, so edits to a published
+        # report cannot reach the installed package.
+        try:
+            shutil.copyfile(_REPORT_ASSETS_DIR / name, assets_dir / name)
+        except FileNotFoundError:
+            continue
 
-    if style_src.exists():
-        shutil.copyfile(style_src, assets_dir / "style.css")
-    if script_src.exists():
-        shutil.copyfile(script_src, assets_dir / "app.js")
+    index_path = html_root / "index.html"
+    html_paths = {
+        "html_index": index_path,
+        "html_assets_dir": assets_dir,
+    }
+    if not results:
+        # Nothing to tabulate or chart: the empty-state page is fixed text.
+        _write_utf8(index_path, _EMPTY_REPORT_HTML)
+        return html_paths
 
-    for chart in list(chart_paths.values()) + list(task_chart_paths.values()):
-        if chart.exists():
-            shutil.copyfile(chart, assets_dir / chart.name)
+    for chart in (*chart_paths.values(), *task_chart_paths.values()):
+        if chart in existing_charts:
+            _link_or_copy(chart, assets_dir / chart.name)
 
-    task_aggregates = aggregate_by_task_mode(results)
-    index_path = html_root / "index.html"
-    index_path.write_text(
+    _write_utf8(
+        index_path,
         _render_html_report(
             results=results,
             aggregates=aggregates,
+            sorted_modes=sorted_modes,
             mode_deltas=mode_deltas,
             task_aggregates=task_aggregates,
             task_deltas=task_deltas,
             chart_paths=chart_paths,
             task_chart_paths=task_chart_paths,
-        )
+            existing_charts=existing_charts,
+        ),
     )
-
-    return {
-        "html_index": index_path,
-        "html_assets_dir": assets_dir,
-    }
+    return html_paths
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link a generated chart into the HTML assets, copying only where links fail."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+# Column order of the mode and task metric tables in the Markdown and HTML reports.
+_METRIC_NAMES = (
+    "latency_ms",
+    "latency_p50",
+    "latency_p95",
+    "tokens_in",
+    "tokens_out",
+    "rule_score",
+    "llm_score",
+    "cost_usd",
+)
+_MARKDOWN_METRIC_HEADERS = ("mode", *_METRIC_NAMES)
+# Metric cells are formatted numbers or blank, so alignment needs no per-cell parse.
+_MARKDOWN_NUMERIC_COLUMNS = (False, *(True for _ in _METRIC_NAMES))
+_ESCAPED_METRIC_HEADERS = tuple(escape(name) for name in _MARKDOWN_METRIC_HEADERS)
 
 
 def _render_html_report(
     *,
     results: List[Dict],
     aggregates: Dict[str, Dict[str, float]],
-    mode_deltas: Dict[str, Dict[str, float]],
-    task_aggregates: Dict[str, Dict[str, Dict[str, float]]],
-    task_deltas: Dict[str, Dict[str, Dict[str, float]]],
+    sorted_modes: ModeRows,
+    mode_deltas: ModeRows,
+    task_aggregates: TaskRows,
+    task_deltas: TaskRows,
     chart_paths: Dict[str, Path],
     task_chart_paths: Dict[str, Path],
+    existing_charts: Set[Path],
 ) -> str:
-    metrics = [
-        "latency_ms",
-        "latency_p50",
-        "latency_p95",
-        "tokens_in",
-        "tokens_out",
-        "rule_score",
-        "llm_score",
-        "cost_usd",
-    ]
+    # Every mode in a delta or per-task table also appears in the mode aggregates,
+    # so each label is escaped once here rather than once per table row.
+    escaped_modes = {mode: escape(mode) for mode, _ in sorted_modes}
     aggregate_rows = []
-    for mode, mode_metrics in sorted(aggregates.items()):
-        row = [escape(mode)]
-        for metric in metrics:
-            row.append(_format_metric(mode_metrics.get(metric)))
+    for mode, mode_metrics in sorted_modes:
+        row = [escaped_modes[mode]]
+        for metric in _METRIC_NAMES:
+            row.append(_fmt(mode_metrics.get(metric)))
         aggregate_rows.append(row)
 
     delta_rows = []
-    for mode, mode_metrics in sorted(mode_deltas.items()):
-        row = [escape(mode)]
-        for metric in metrics:
-            row.append(_format_metric(mode_metrics.get(metric), signed=True))
+    for mode, mode_metrics in mode_deltas:
+        row = [escaped_modes[mode]]
+        for metric in _METRIC_NAMES:
+            row.append(_fmt_signed(mode_metrics.get(metric)))
         delta_rows.append(row)
 
     aggregate_table = _render_html_table(
         table_id="aggregate-table",
         caption="Average metrics by mode.",
-        headers=["mode", *metrics],
         rows=aggregate_rows,
     )
     delta_table = _render_html_table(
         table_id="delta-table",
         caption="Delta for each mode compared with baseline.",
-        headers=["mode", *metrics],
         rows=delta_rows,
     )
 
+    task_delta_map = dict(task_deltas)
     task_sections: List[str] = []
-    for task_id, task_modes in sorted(task_aggregates.items()):
+    for task_id, task_modes in task_aggregates:
         rows = []
-        for mode, mode_metrics in sorted(task_modes.items()):
-            row = [escape(mode)]
-            for metric in metrics:
-                row.append(_format_metric(mode_metrics.get(metric)))
+        for mode, mode_metrics in task_modes:
+            row = [escaped_modes[mode]]
+            for metric in _METRIC_NAMES:
+                row.append(_fmt(mode_metrics.get(metric)))
             rows.append(row)
-        table = _render_html_table(
-            table_id=f"task-{_sanitize_name(task_id)}-table",
-            caption=f"Metrics for task {task_id}.",
-            headers=["mode", *metrics],
-            rows=rows,
+        task_sections.append("<article class=\"task-card\">")
+        task_sections.append(f"<h3>{escape(task_id)}</h3>")
+        task_sections.append(
+            _render_html_table(
+                table_id=f"task-{_sanitize_name(task_id)}-table",
+                caption=f"Metrics for task {task_id}.",
+                rows=rows,
+            )
         )
-        task_delta = task_deltas.get(task_id)
-        delta_note = "<p class=\"callout warning\">Baseline mode is required to compute task deltas.</p>"
+        task_delta = task_delta_map.get(task_id)
         if task_delta:
             delta_rows_for_task = []
-            for mode, mode_metrics in sorted(task_delta.items()):
-                row = [escape(mode)]
-                for metric in metrics:
-                    row.append(_format_metric(mode_metrics.get(metric), signed=True))
+            for mode, mode_metrics in task_delta:
+                row = [escaped_modes[mode]]
+                for metric in _METRIC_NAMES:
+                    row.append(_fmt_signed(mode_metrics.get(metric)))
                 delta_rows_for_task.append(row)
-            delta_note = _render_html_table(
-                table_id=f"task-{_sanitize_name(task_id)}-delta-table",
-                caption=f"Delta vs baseline for task {task_id}.",
-                headers=["mode", *metrics],
-                rows=delta_rows_for_task,
+            task_sections.append(
+                _render_html_table(
+                    table_id=f"task-{_sanitize_name(task_id)}-delta-table",
+                    caption=f"Delta vs baseline for task {task_id}.",
+                    rows=delta_rows_for_task,
+                )
             )
-        task_sections.append(
-            "<article class=\"task-card\">"
-            f"<h3>{escape(task_id)}</h3>"
-            f"{table}"
-            f"{delta_note}"
-            "</article>"
-        )
+        else:
+            task_sections.append(
+                "<p class=\"callout warning\">Baseline mode is required to compute task deltas.</p>"
+            )
+        task_sections.append("</article>")
 
     chart_figures: List[str] = []
     for key in ("latency", "rule_score"):
         chart = chart_paths.get(key)
-        if chart and chart.exists():
+        if chart in existing_charts:
             chart_figures.append(
                 "<figure class=\"chart-card\">"
                 f"<img src=\"assets/{escape(chart.name)}\" alt=\"{escape(key.replace('_', ' '))} chart\" loading=\"lazy\" />"
@@ -433,7 +718,7 @@ def _render_html_report(
                 "</figure>"
             )
     for key, chart in sorted(task_chart_paths.items()):
-        if chart.exists():
+        if chart in existing_charts:
             task_id = key.rsplit("_latency", 1)[0]
             chart_figures.append(
                 "<figure class=\"chart-card\">"
@@ -444,122 +729,137 @@ def _render_html_report(
 
     summary_cards = _render_summary_cards(results, aggregates)
     onboarding = _render_onboarding_section(results)
-    task_sections_html = (
-        "".join(task_sections)
-        if task_sections
-        else '<p class="callout">No task-level rows available.</p>'
-    )
-    chart_grid_html = (
-        "".join(chart_figures)
-        if chart_figures
-        else '<p class="callout">No chart assets were generated.</p>'
-    )
-    empty_state = ""
-    if not results:
-        empty_state = (
-            "<section id=\"empty-state\" class=\"panel\">"
-            "<h2>No benchmark results were recorded</h2>"
-            "<p>Run the benchmark first, then refresh this report.</p>"
-            "<pre><code>skillbench-pd --modes baseline progressive --repetitions 1</code></pre>"
-            "</section>"
-        )
-
     delta_notice = ""
-    if results and "baseline" not in aggregates:
+    if "baseline" not in aggregates:
         delta_notice = "<p class=\"callout warning\">Baseline mode is required to compute deltas.</p>"
 
-    return (
-        "<!doctype html>\n"
-        "<html lang=\"en\">\n"
-        "<head>\n"
-        "  <meta charset=\"utf-8\" />\n"
-        "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
-        "  <title>SkillBench-PD Report</title>\n"
-        "  <link rel=\"stylesheet\" href=\"assets/style.css\" />\n"
-        "</head>\n"
-        "<body>\n"
-        "  <a class=\"skip-link\" href=\"#main\">Skip to content</a>\n"
-        "  <header class=\"topbar\">\n"
-        "    <h1>SkillBench-PD Report</h1>\n"
-        "    <p>Shareable benchmark summary for baseline, naive, and progressive prompting modes.</p>\n"
-        "    <nav aria-label=\"Report sections\">\n"
-        "      <a href=\"#overview\">Overview</a>\n"
-        "      <a href=\"#aggregates\">Aggregated metrics</a>\n"
-        "      <a href=\"#deltas\">Delta vs baseline</a>\n"
-        "      <a href=\"#tasks\">Per-task breakdown</a>\n"
-        "      <a href=\"#help\">Help & Methodology</a>\n"
-        "    </nav>\n"
-        "  </header>\n"
-        "  <main id=\"main\" tabindex=\"-1\">\n"
-        f"    {onboarding}\n"
-        f"    {empty_state}\n"
+    # Fragments are appended in page order and joined once at the end, so the
+    # per-task tables are never copied into intermediate strings.
+    body_parts: List[str] = [
+        _HTML_PAGE_HEAD,
+        f"    {onboarding}\n",
+        "    \n"
         "    <section id=\"overview\" class=\"panel\">\n"
         "      <h2>Overview</h2>\n"
-        "      <p>Summary of benchmark results and key deltas.</p>\n"
-        f"      {summary_cards}\n"
+        "      <p>Summary of benchmark results and key deltas.</p>\n",
+        f"      {summary_cards}\n",
         "    </section>\n"
         "    <section id=\"aggregates\" class=\"panel\">\n"
         "      <h2>Aggregated metrics</h2>\n"
-        "      <p>Average latency, token usage, and quality by mode.</p>\n"
-        f"      {aggregate_table}\n"
+        "      <p>Average latency, token usage, and quality by mode.</p>\n",
+        f"      {aggregate_table}\n",
         "    </section>\n"
         "    <section id=\"deltas\" class=\"panel\">\n"
         "      <h2>Delta vs baseline</h2>\n"
-        "      <p>How each mode differs from baseline. Positive values indicate increases.</p>\n"
-        f"      {delta_notice}\n"
-        f"      {delta_table}\n"
+        "      <p>How each mode differs from baseline. Positive values indicate increases.</p>\n",
+        f"      {delta_notice}\n",
+        f"      {delta_table}\n",
         "    </section>\n"
         "    <section id=\"tasks\" class=\"panel\">\n"
         "      <h2>Per-task breakdown</h2>\n"
         "      <p>Use this section to identify where progressive disclosure helps or regresses.</p>\n"
-        f"      {task_sections_html}\n"
+        "      ",
+    ]
+    if task_sections:
+        body_parts.extend(task_sections)
+    else:
+        body_parts.append('<p class="callout">No task-level rows available.</p>')
+    body_parts.append(
+        "\n"
         "    </section>\n"
         "    <section id=\"charts\" class=\"panel\">\n"
         "      <h2>Charts</h2>\n"
         "      <p>Static chart assets are copied into <code>html/assets</code> for easy sharing.</p>\n"
-        f"      <div class=\"chart-grid\">{chart_grid_html}</div>\n"
-        "    </section>\n"
-        "    <section id=\"help\" class=\"panel\">\n"
-        "      <h2>Help & Methodology</h2>\n"
-        "      <p>How to interpret this report and next steps.</p>\n"
-        "      <ul>\n"
-        "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Baseline uses only task instructions with no Skill context.\">Baseline</span> is the control mode.</li>\n"
-        "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Naive mode appends the entire Skill folder and often inflates context size.\">Naive</span> shows whole-skill prompt loading costs.</li>\n"
-        "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Progressive mode includes SKILL.md and relevant references chosen by section cues.\">Progressive</span> approximates Agent Skills disclosure behavior.</li>\n"
-        "      </ul>\n"
-        "      <p>Share this report by publishing <code>results/html/</code> to static hosting (GitHub Pages or Vercel).</p>\n"
-        "    </section>\n"
-        "  </main>\n"
-        "  <script src=\"assets/app.js\"></script>\n"
-        "</body>\n"
-        "</html>\n"
+        "      <div class=\"chart-grid\">"
     )
-
-
-def _format_metric(value: float | None, *, signed: bool = False) -> str:
-    if value is None:
-        return "—"
-    if signed:
-        return f"{value:+.3f}"
-    return f"{value:.3f}"
-
-
-def _render_html_table(*, table_id: str, caption: str, headers: List[str], rows: List[List[str]]) -> str:
-    head = "".join(f"<th scope=\"col\">{escape(header)}</th>" for header in headers)
+    if chart_figures:
+        body_parts.extend(chart_figures)
+    else:
+        body_parts.append('<p class="callout">No chart assets were generated.</p>')
+    body_parts.append("</div>\n    </section>\n")
+    body_parts.append(_HTML_PAGE_TAIL)
+    return "".join(body_parts)
+
+
+_HTML_PAGE_HEAD = (
+    "<!doctype html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "  <meta charset=\"utf-8\" />\n"
+    "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+    "  <title>SkillBench-PD Report</title>\n"
+    "  <link rel=\"stylesheet\" href=\"assets/style.css\" />\n"
+    "</head>\n"
+    "<body>\n"
+    "  <a class=\"skip-link\" href=\"#main\">Skip to content</a>\n"
+    "  <header class=\"topbar\">\n"
+    "    <h1>SkillBench-PD Report</h1>\n"
+    "    <p>Shareable benchmark summary for baseline, naive, and progressive prompting modes.</p>\n"
+    "    <nav aria-label=\"Report sections\">\n"
+    "      <a href=\"#overview\">Overview</a>\n"
+    "      <a href=\"#aggregates\">Aggregated metrics</a>\n"
+    "      <a href=\"#deltas\">Delta vs baseline</a>\n"
+    "      <a href=\"#tasks\">Per-task breakdown</a>\n"
+    "      <a href=\"#help\">Help & Methodology</a>\n"
+    "    </nav>\n"
+    "  </header>\n"
+    "  <main id=\"main\" tabindex=\"-1\">\n"
+)
+
+_HTML_PAGE_TAIL = (
+    "    <section id=\"help\" class=\"panel\">\n"
+    "      <h2>Help & Methodology</h2>\n"
+    "      <p>How to interpret this report and next steps.</p>\n"
+    "      <ul>\n"
+    "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Baseline uses only task instructions with no Skill context.\">Baseline</span> is the control mode.</li>\n"
+    "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Naive mode appends the entire Skill folder and often inflates context size.\">Naive</span> shows whole-skill prompt loading costs.</li>\n"
+    "        <li><span class=\"info-chip\" tabindex=\"0\" title=\"Progressive mode includes SKILL.md and relevant references chosen by section cues.\">Progressive</span> approximates Agent Skills disclosure behavior.</li>\n"
+    "      </ul>\n"
+    "      <p>Share this report by publishing <code>results/html/</code> to static hosting (GitHub Pages or Vercel).</p>\n"
+    "    </section>\n"
+    "  </main>\n"
+    "  <script src=\"assets/app.js\"></script>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+
+# Placeholder for metrics a mode or task did not record.
+_DASH = "—"
+
+
+def _fmt(value: float | None) -> str:
+    return _DASH if value is None else f"{value:.3f}"
+
+
+def _fmt_signed(value: float | None) -> str:
+    return _DASH if value is None else f"{value:+.3f}"
+
+
+def _render_html_table(
+    *,
+    table_id: str,
+    caption: str,
+    rows: List[List[str]],
+    headers: Sequence[str] = _ESCAPED_METRIC_HEADERS,
+) -> str:
+    """Render a table whose ``headers`` and ``rows`` cells are already HTML-escaped."""
+    parts = [
+        f"<div class=\"table-wrap\"><table id=\"{escape(table_id)}\">",
+        f"<caption>{escape(caption)}</caption>",
+        "<thead><tr>",
+    ]
+    parts.extend(f"<th scope=\"col\">{header}</th>" for header in headers)
+    parts.append("</tr></thead><tbody>")
     if rows:
-        body_rows = []
         for row in rows:
-            cells = "".join(f"<td>{cell}</td>" for cell in row)
-            body_rows.append(f"<tr>{cells}</tr>")
-        body = "".join(body_rows)
+            parts.append("<tr>")
+            parts.extend(f"<td>{cell}</td>" for cell in row)
+            parts.append("</tr>")
     else:
-        body = f"<tr><td colspan=\"{len(headers)}\">No data available.</td></tr>"
-    return (
-        f"<div class=\"table-wrap\"><table id=\"{escape(table_id)}\">"
-        f"<caption>{escape(caption)}</caption>"
-        f"<thead><tr>{head}</tr></thead>"
-        f"<tbody>{body}</tbody></table></div>"
-    )
+        parts.append(f"<tr><td colspan=\"{len(headers)}\">No data available.</td></tr>")
+    parts.append("</tbody></table></div>")
+    return "".join(parts)
 
 
 def _render_summary_cards(results: List[Dict], aggregates: Dict[str, Dict[str, float]]) -> str:
@@ -572,7 +872,7 @@ def _render_summary_cards(results: List[Dict], aggregates: Dict[str, Dict[str, f
         ("Tasks", str(len(task_ids))),
     ]
     baseline_latency = aggregates.get("baseline", {}).get("latency_ms")
-    cards.append(("Baseline latency (ms)", _format_metric(baseline_latency)))
+    cards.append(("Baseline latency (ms)", _fmt(baseline_latency)))
     pieces = []
     for label, value in cards:
         pieces.append(
@@ -599,27 +899,53 @@ def _render_onboarding_section(results: List[Dict]) -> str:
     )
 
 
-def _percentile(values: List[float], percentile: float) -> Optional[float]:
-    if not values:
-        return None
-    if percentile <= 0:
-        return min(values)
-    if percentile >= 100:
-        return max(values)
-    sorted_vals = sorted(values)
-    rank = (len(sorted_vals) - 1) * (percentile / 100)
-    lower = int(rank)
-    upper = min(lower + 1, len(sorted_vals) - 1)
-    weight = rank - lower
-    return sorted_vals[lower] * (1 - weight) + sorted_vals[upper] * weight
+_EMPTY_REPORT_HTML = (
+    _HTML_PAGE_HEAD
+    + f"    {_render_onboarding_section([])}\n"
+    "    <section id=\"empty-state\" class=\"panel\">"
+    "<h2>No benchmark results were recorded</h2>"
+    "<p>Run the benchmark first, then refresh this report.</p>"
+    "<pre><code>skillbench-pd --modes baseline progressive --repetitions 1</code></pre>"
+    "</section>\n"
+    + _HTML_PAGE_TAIL
+)
+
+
+# Runs of anything other than word characters or "-" become a single dash.
+_SANITIZE_RE = re.compile(r"[^\w-]+")
 
 
+@lru_cache(maxsize=1024)
 def _sanitize_name(name: str) -> str:
-    safe = "".join(ch if ch.isalnum() or ch in "-_" else "-" for ch in name)
-    return safe.strip("-_") or "task"
+    return _SANITIZE_RE.sub("-", name).strip("-_") or "task"
+
+
+def _new_figure() -> tuple[Figure, Axes]:
+    """Create a headless Agg figure. It is never registered with pyplot, so it
+    needs no ``plt.close`` and is freed as soon as it goes out of scope."""
+    # matplotlib is imported on first chart rather than with the module, so
+    # aggregation-only callers never pay for it.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(4, 3))
+    FigureCanvasAgg(fig)
+    # Fixed margins sized for the report charts; unlike tight_layout they need
+    # no text-measuring draw pass before every save.
+    fig.subplots_adjust(left=0.16, right=0.96, bottom=0.14, top=0.9)
+    return fig, fig.subplots()
+
+
+def _figure_to_png_bytes(fig: Figure, *, dpi: int = CHART_DPI) -> bytes:
+    """Encode ``fig`` as PNG in memory, for callers that embed or write the bytes themselves."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, metadata=_PNG_METADATA, pil_kwargs=_PNG_SAVE_OPTIONS)
+    return buffer.getvalue()
 
 
 def _bar_chart(
+    fig: Figure,
+    ax: Axes,
     modes: List[str],
     values: List[float],
     *,
@@ -627,8 +953,9 @@ def _bar_chart(
     title: str,
     path: Path,
     ylim: Optional[tuple[float, float]] = None,
+    dpi: int = CHART_DPI,
 ) -> None:
-    fig, ax = plt.subplots(figsize=(4, 3))
+    ax.clear()
     ax.bar(modes, values, color=["#6C8EBF", "#F6C344", "#88C999"][: len(modes)])
     ax.set_ylabel(ylabel)
     ax.set_title(title)
@@ -636,18 +963,17 @@ def _bar_chart(
         ax.set_ylim(*ylim)
     for idx, value in enumerate(values):
         ax.text(idx, value, f"{value:.2f}", ha="center", va="bottom", fontsize=8)
-    fig.tight_layout()
-    fig.savefig(path, dpi=150)
-    plt.close(fig)
+    path.write_bytes(_figure_to_png_bytes(fig, dpi=dpi))
 
 
 def _write_markdown(
     path: Path,
-    aggregates: Dict[str, Dict[str, float]],
-    mode_deltas: Dict[str, Dict[str, float]],
-    task_deltas: Dict[str, Dict[str, Dict[str, float]]],
+    aggregates: ModeRows,
+    mode_deltas: ModeRows,
+    task_deltas: TaskRows,
     chart_paths: Dict[str, Path],
     task_chart_paths: Dict[str, Path],
+    existing_charts: Set[Path],
     results: List[Dict],
 ) -> None:
     lines: List[str] = [
@@ -656,37 +982,20 @@ def _write_markdown(
         "## Aggregated metrics by mode",
     ]
     if aggregates:
-        table_rows = []
-        headers = [
-            "mode",
-            "latency_ms",
-            "latency_p50",
-            "latency_p95",
-            "tokens_in",
-            "tokens_out",
-            "rule_score",
-            "llm_score",
-            "cost_usd",
-        ]
-        for mode, metrics in sorted(aggregates.items()):
-            row = [mode]
-            for metric in headers[1:]:
-                value = metrics.get(metric)
-                if isinstance(value, (int, float)):
-                    row.append(f"{value:.3f}")
-                else:
-                    row.append("")
-            table_rows.append(row)
-        lines.append(tabulate(table_rows, headers=headers, tablefmt="github"))
+        lines.append(_markdown_metric_table(aggregates))
+        lines.extend(
+            [
+                "",
+                "## Charts",
+                f"![Latency by mode]({chart_paths['latency'].name})",
+                f"![Rule quality by mode]({chart_paths['rule_score'].name})",
+            ]
+        )
     else:
         lines.append("_No results recorded._")
 
     lines.extend(
         [
-            "",
-            "## Charts",
-            f"![Latency by mode]({chart_paths['latency'].name})",
-            f"![Rule quality by mode]({chart_paths['rule_score'].name})",
             "",
             "## Raw run count",
             f"- Total records: {len(results)}",
@@ -694,73 +1003,42 @@ def _write_markdown(
     )
 
     if mode_deltas:
-        headers = [
-            "mode",
-            "latency_ms",
-            "latency_p50",
-            "latency_p95",
-            "tokens_in",
-            "tokens_out",
-            "rule_score",
-            "llm_score",
-            "cost_usd",
-        ]
-        rows = []
-        for mode, metrics in sorted(mode_deltas.items()):
-            row = [mode]
-            for metric in headers[1:]:
-                value = metrics.get(metric)
-                if isinstance(value, (int, float)):
-                    row.append(f"{value:+.3f}")
-                else:
-                    row.append("")
-            rows.append(row)
         lines.extend(
             [
                 "",
                 "## Mode deltas vs baseline",
                 "Positive numbers indicate an increase relative to baseline.",
-                tabulate(rows, headers=headers, tablefmt="github"),
+                _markdown_metric_table(mode_deltas, signed=True),
             ]
         )
 
     if task_deltas:
         lines.append("")
         lines.append("## Per-task deltas vs baseline")
-        for task_id, modes in sorted(task_deltas.items()):
-            headers = [
-                "mode",
-                "latency_ms",
-                "latency_p50",
-                "latency_p95",
-                "tokens_in",
-                "tokens_out",
-                "rule_score",
-                "llm_score",
-                "cost_usd",
-            ]
-            rows = []
-            for mode, metrics in sorted(modes.items()):
-                row = [mode]
-                for metric in headers[1:]:
-                    value = metrics.get(metric)
-                    if isinstance(value, (int, float)):
-                        row.append(f"{value:+.3f}")
-                    else:
-                        row.append("")
-                rows.append(row)
+        for task_id, modes in task_deltas:
             lines.append(f"### Task {task_id}")
-            lines.append(tabulate(rows, headers=headers, tablefmt="github"))
+            lines.append(_markdown_metric_table(modes, signed=True))
             lines.append("")
 
     if task_chart_paths:
         lines.append("## Task-level latency histograms")
         for key, path_obj in sorted(task_chart_paths.items()):
-            if not path_obj.exists():
+            if path_obj not in existing_charts:
                 continue
             task_id = key.rsplit("_latency", 1)[0]
             lines.append(f"### {task_id}")
             lines.append(f"![Latency histogram for {task_id}]({path_obj.name})")
             lines.append("")
 
-    path.write_text("\n".join(lines))
+    _write_utf8(path, "\n".join(lines))
+
+
+def _markdown_metric_table(rows: ModeRows, *, signed: bool = False) -> str:
+    # Aggregate values are always floats or absent, so one bound format method
+    # per table replaces a per-cell type check and format-spec parse.
+    fmt = "{:+.3f}".format if signed else "{:.3f}".format
+    table_rows = [
+        [mode, *("" if (value := metrics.get(metric)) is None else fmt(value) for metric in _METRIC_NAMES)]
+        for mode, metrics in rows
+    ]
+    return render_github_table(_MARKDOWN_METRIC_HEADERS, table_rows, numeric_columns=_MARKDOWN_NUMERIC_COLUMNS)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+
+def render_github_table(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[object]],
+    *,
+    numeric_columns: Optional[Sequence[bool]] = None,
+) -> str:
+    """Render a GitHub-flavoured Markdown table.
+
+    Cells are emitted exactly as given (pre-formatted numbers keep their sign and
+    precision). Columns whose non-empty cells are all numeric are right-aligned;
+    callers that already know which columns are numeric can pass
+    ``numeric_columns`` to skip parsing every cell.
+    """
+    cells = [[str(cell) for cell in row] for row in rows]
+    columns = list(zip(*cells)) if cells else [() for _ in headers]
+    widths: List[int] = []
+    numeric: List[bool] = []
+    for index, (header, column) in enumerate(zip(headers, columns)):
+        widths.append(max([len(header), *(len(cell) for cell in column)]))
+        if numeric_columns is not None:
+            numeric.append(numeric_columns[index])
+        else:
+            numeric.append(any(column) and all(_is_number(cell) for cell in column if cell))
+
+    def render_row(values: Sequence[str]) -> str:
+        padded = [
+            value.rjust(width) if is_numeric else value.ljust(width)
+            for value, width, is_numeric in zip(values, widths, numeric)
+        ]
+        return "| " + " | ".join(padded) + " |"
+
+    lines = [render_row([str(header) for header in headers])]
+    lines.append("|" + "|".join("-" * (width + 2) for width in widths) + "|")
+    lines.extend(render_row(row) for row in cells)
+    return "\n".join(lines)
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
@@ -20,6 +20,9 @@ CHART_FILES = [
 ]
 
 
+_AGGREGATE_FIELDS = ("latency_ms", "tokens_in", "rule_score", "cost_usd")
+
+
 def _to_float(value: str) -> float | None:
     value = value.strip()
     if not value:
@@ -29,21 +32,49 @@ def _to_float(value: str) -> float | None:
 
 def _read_aggregates() -> list[dict]:
     rows: list[dict] = []
-    with (SAMPLE_DIR / "aggregates_by_mode.csv").open("r", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        for row in reader:
-            rows.append(
-                {
-                    "mode": row.get("mode", ""),
-                    "latency_ms": _to_float(row.get("latency_ms", "") or "") or 0.0,
-                    "tokens_in": _to_float(row.get("tokens_in", "") or "") or 0.0,
-                    "rule_score": _to_float(row.get("rule_score", "") or "") or 0.0,
-                    "cost_usd": _to_float(row.get("cost_usd", "") or "") or 0.0,
-                }
-            )
+    with (SAMPLE_DIR / "aggregates_by_mode.csv").open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        # Resolve each wanted column's position once; absent columns read as blank.
+        mode_col = _column(header, "mode")
+        field_cols = [(field, _column(header, field)) for field in _AGGREGATE_FIELDS]
+        for values in reader:
+            row: dict = {"mode": _cell(values, mode_col)}
+            for field, col in field_cols:
+                row[field] = _to_float(_cell(values, col)) or 0.0
+            rows.append(row)
     return rows
 
 
+def _read_task_counts() -> tuple[int, int, int]:
+    """Return ``(record_count, task_count, mode_count)`` from the per-task aggregates."""
+    record_count = 0
+    task_ids: set[str] = set()
+    modes: set[str] = set()
+    with (SAMPLE_DIR / "aggregates_by_task.csv").open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        task_col = _column(header, "task_id")
+        mode_col = _column(header, "mode")
+        for values in reader:
+            record_count += 1
+            task_ids.add(_cell(values, task_col))
+            modes.add(_cell(values, mode_col))
+    task_ids.discard("")
+    modes.discard("")
+    return record_count, len(task_ids), len(modes)
+
+
+def _column(header: list[str], name: str) -> int | None:
+    return header.index(name) if name in header else None
+
+
+def _cell(values: list[str], col: int | None) -> str:
+    if col is None or col >= len(values):
+        return ""
+    return values[col]
+
+
 def build_showcase_data() -> dict:
     SHOWCASE_CHARTS.mkdir(parents=True, exist_ok=True)
     for chart in CHART_FILES:
@@ -56,15 +87,7 @@ def build_showcase_data() -> dict:
     if aggregates:
         best_cost_mode = min(aggregates, key=lambda row: row.get("cost_usd", float("inf"))).get("mode", "")
 
-    record_count = 0
-    task_count = 0
-    mode_count = 0
-
-    with (SAMPLE_DIR / "aggregates_by_task.csv").open("r", encoding="utf-8") as fh:
-        task_rows = list(csv.DictReader(fh))
-        record_count = len(task_rows)
-        task_count = len({row.get("task_id", "") for row in task_rows if row.get("task_id")})
-        mode_count = len({row.get("mode", "") for row in task_rows if row.get("mode")})
+    record_count, task_count, mode_count = _read_task_counts()
 
     output = {
         "generated_from": "sample_results",
@@ -195,3 +195,32 @@ def test_cli_fail_on_regression_exits_non_zero(tmp_path, monkeypatch):
     with pytest.raises(SystemExit) as exc:
         cli.main(args)
     assert exc.value.code == 2
+
+
+def test_summarize_matches_report_aggregates():
+    from bench.report import aggregate_by_mode
+
+    results = [
+        {"mode": "baseline", "latency_ms": 10.0, "rule_score": 0.5, "tokens_in": 4},
+        {"mode": "baseline", "latency_ms": 30.0, "rule_score": 0.7, "tokens_in": 6, "cost_usd": 0.1},
+        {"mode": "progressive", "latency_ms": 20.0, "rule_score": 0.9},
+    ]
+
+    aggregates, percentile_map = cli.summarize(results, [50.0, 90.0])
+
+    assert aggregates == aggregate_by_mode(results)
+    assert percentile_map["baseline"] == {50.0: 20.0, 90.0: 28.0}
+    assert percentile_map["progressive"] == {50.0: 20.0, 90.0: 20.0}
+
+
+def test_summarize_rounds_means_like_statistics_mean():
+    from statistics import mean
+
+    values = [0.004, 0.39, 0.44, 0.027]
+    results = [{"mode": "baseline", "latency_ms": 1.0, "rule_score": value} for value in values]
+
+    aggregates, _ = cli.summarize(results, [])
+
+    # A float sum / count lands just above 0.21525 and rounds to 0.2153; the exact
+    # mean (and the written reports) round to 0.2152.
+    assert aggregates["baseline"]["rule_score"] == round(mean(values), 4) == 0.2152
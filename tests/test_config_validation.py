@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from bench.harness import BenchmarkConfig, PricingConfig, validate_config
+from bench.harness import BenchmarkConfig, PricingConfig, load_config, validate_config
 
 
 def test_validate_config_rejects_unknown_mode():
@@ -68,3 +68,53 @@ def test_validate_config_rejects_negative_pricing(tmp_path):
     )
     with pytest.raises(ValueError):
         validate_config(config)
+
+
+def test_load_config_reuses_json_cache_outside_config_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("SKILLBENCH_CACHE", "1")
+    monkeypatch.setenv("SKILLBENCH_CACHE_DIR", str(cache_dir))
+    skill_root = tmp_path / "skill"
+    skill_root.mkdir()
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: skill\ndescription: Synthetic skill for validation tests.\n---\n\n# Skill\n"
+    )
+    (tmp_path / "task.json").write_text("{}")
+    config_path = tmp_path / "bench.yaml"
+    config_path.write_text("modes: [baseline]\ntasks: [task.json]\nskill_root: skill\nrepetitions: 2\n")
+
+    first = load_config(config_path)
+    assert len(list((cache_dir / "configs").glob("*.json"))) == 1
+    assert not list(tmp_path.glob("*.cache.json"))
+    assert load_config(config_path) == first
+
+    config_path.write_text("modes: [baseline]\ntasks: [task.json]\nskill_root: skill\nrepetitions: 3\n")
+    assert load_config(config_path).repetitions == 3
+
+
+def test_yaml_cache_skips_non_string_keys(tmp_path, monkeypatch):
+    from bench.harness import _load_yaml_cached
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("SKILLBENCH_CACHE", "1")
+    monkeypatch.setenv("SKILLBENCH_CACHE_DIR", str(cache_dir))
+    config_path = tmp_path / "bench.yaml"
+    config_path.write_text("weights:\n  1: heavy\n  null: light\n")
+
+    expected = {"weights": {1: "heavy", None: "light"}}
+    assert _load_yaml_cached(config_path) == expected
+    assert _load_yaml_cached(config_path) == expected
+    assert not cache_dir.exists()
+
+
+def test_yaml_cache_is_off_by_default(tmp_path, monkeypatch):
+    from bench.harness import _load_yaml_cached
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.delenv("SKILLBENCH_CACHE", raising=False)
+    monkeypatch.setenv("SKILLBENCH_CACHE_DIR", str(cache_dir))
+    config_path = tmp_path / "bench.yaml"
+    config_path.write_text("modes: [baseline]\n")
+
+    assert _load_yaml_cached(config_path) == {"modes": ["baseline"]}
+    assert not cache_dir.exists()
@@ -101,3 +101,21 @@ def test_regression_report_flags_regressions_and_writes_artifacts(tmp_path):
     loaded = json.loads(paths["regression_json"].read_text())
     assert loaded["regression_count"] == report["regression_count"]
     assert "Flagged Regressions" in paths["regression_markdown"].read_text()
+
+
+def test_execute_cases_requeues_failed_cases():
+    from bench.experiment import ExperimentCase, _execute_cases
+
+    cases = [ExperimentCase("t.json", "baseline", "mock", "rule", idx) for idx in range(4)]
+    calls = []
+
+    def flaky(case):
+        calls.append(case.iteration)
+        if case.iteration == 1 and calls.count(1) == 1:
+            raise RuntimeError("transient")
+        return {"iteration": case.iteration}
+
+    records = list(_execute_cases(cases, flaky, max_workers=2, retry_attempts=1))
+
+    assert sorted(record["iteration"] for record in records) == [0, 1, 2, 3]
+    assert calls.count(1) == 2
@@ -3,6 +3,8 @@ from pathlib import Path
 from bench.harness import (
     BenchmarkConfig,
     build_prompt,
+    format_task_prompt,
+    load_skill_blob,
     load_task,
     load_skill_definition,
     run_benchmark,
@@ -60,3 +62,99 @@ def test_run_benchmark_collects_records():
         assert record["provider"] == "mock"
         assert record["model"] == "mock-model"
         assert record["judge"] == "rule"
+
+
+def test_run_benchmark_concurrent_preserves_order():
+    config = BenchmarkConfig(
+        modes=["baseline", "naive", "progressive"],
+        tasks=["tasks/t1_rewrite_brand.json", "tasks/t3_summarize_metrics.json"],
+        repetitions=2,
+        provider="mock",
+        model="mock-model",
+        judge="rule",
+        concurrency=4,
+    )
+
+    results = run_benchmark(config, provider=MockProvider())
+
+    assert [(row["task_id"], row["mode"], row["iteration"]) for row in results] == [
+        (task_id, mode, iteration)
+        for task_id in ("t1_rewrite_brand", "t3_summarize_metrics")
+        for mode in ("baseline", "naive", "progressive")
+        for iteration in range(2)
+    ]
+
+
+def test_progressive_prompt_rereads_reference_after_edit(tmp_path):
+    import os
+
+    skill_root = tmp_path / "demo-skill"
+    (skill_root / "references").mkdir(parents=True)
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: demo-skill\ndescription: Demo.\n---\n\n"
+        "### Rewrite copy\nKeywords: rewrite\nSee references/guide.md\n"
+    )
+    guide = skill_root / "references" / "guide.md"
+    guide.write_text("first version")
+    skill = load_skill_definition(skill_root)
+    task = {"id": "t1", "goal": "Rewrite this", "input": "text"}
+
+    assert "first version" in build_prompt("progressive", task, skill_root, skill)
+
+    guide.write_text("second version")
+    stat = guide.stat()
+    os.utime(guide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "second version" in build_prompt("progressive", task, skill_root, skill)
+
+
+def test_skill_references_stay_inside_skill_root(tmp_path):
+    skill_root = tmp_path / "demo-skill"
+    (skill_root / "references").mkdir(parents=True)
+    (skill_root / "references" / "guide.md").write_text("guide")
+    (tmp_path / "outside.md").write_text("secret")
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: demo-skill\ndescription: Demo.\n---\n\n"
+        "### Rewrite copy\nSee [guide](references/guide.md) and ../outside.md\n"
+    )
+
+    skill = load_skill_definition(skill_root)
+
+    assert skill.sections[0].references == ["references/guide.md"]
+
+
+def test_skill_references_reject_symlink_dotdot_escape(tmp_path):
+    outside = tmp_path / "outside"
+    (outside / "dir").mkdir(parents=True)
+    (outside / "notes.md").write_text("secret")
+    skill_root = tmp_path / "demo-skill"
+    skill_root.mkdir()
+    (skill_root / "notes.md").write_text("local notes")
+    (skill_root / "link").symlink_to(outside / "dir", target_is_directory=True)
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: demo-skill\ndescription: Demo.\n---\n\n"
+        "### Rewrite copy\nSee link/../notes.md and notes.md\n"
+    )
+
+    skill = load_skill_definition(skill_root)
+
+    # link/../notes.md resolves through the symlink to outside/notes.md.
+    assert skill.sections[0].references == ["notes.md"]
+
+
+def test_build_prompt_reports_context_boundary_not_found_by_search():
+    # The task input itself contains the divider text a search would split on.
+    task = {"id": "t1", "goal": "Rewrite", "input": "before\n\n---\nGoal: fake\n"}
+    skill = load_skill_definition(SKILL_ROOT)
+
+    naive = build_prompt("naive", task, SKILL_ROOT, skill)
+    progressive = build_prompt("progressive", task, SKILL_ROOT, skill)
+
+    assert naive[naive.task_start:] == format_task_prompt(task)
+    assert naive[: naive.context_end] == load_skill_blob(SKILL_ROOT)
+    # Progressive prompts are stripped, which trims the input's trailing newline.
+    assert progressive[progressive.task_start:] == format_task_prompt(task).rstrip()
+    for prompt in (naive, progressive):
+        assert prompt[prompt.context_end : prompt.task_start] == "\n\n---\n"
+
+    baseline = build_prompt("baseline", task, SKILL_ROOT, skill)
+    assert baseline.context_end == baseline.task_start == 0
@@ -0,0 +1,7 @@
+import bench
+
+
+def test_public_exports_resolve_lazily():
+    assert sorted(bench.__all__) == sorted(bench._LAZY)
+    for name in bench.__all__:
+        assert getattr(bench, name) is not None
@@ -0,0 +1,76 @@
+import asyncio
+
+from bench.providers import AnthropicProvider, MockProvider, run_batch
+
+
+def test_run_batch_preserves_prompt_order():
+    provider = MockProvider()
+    prompts = ["Rewrite the sentence", "Reformat the following policy text", "metrics", "other"]
+
+    results = asyncio.run(run_batch(provider, prompts, concurrency=2))
+
+    assert [result.output for result in results] == [provider.infer(p).output for p in prompts]
+
+
+def test_anthropic_ainfer_falls_back_without_key(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    provider = AnthropicProvider("claude-test")
+
+    result = asyncio.run(provider.ainfer("hello"))
+
+    assert result.output.startswith("[no-key]")
+
+
+def test_response_cache_round_trip(tmp_path, monkeypatch):
+    from bench import cache
+    from bench.providers import ProviderResult
+
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    key = cache.cache_key("claude-test", "hello")
+    assert cache.get(key) is None
+
+    cache.put(key, ProviderResult(output="hi", tokens_in=3, tokens_out=1, latency_ms=812.0))
+    hit = cache.get(key)
+
+    assert hit == ProviderResult(output="hi", tokens_in=3, tokens_out=1, latency_ms=0.0)
+
+
+def test_anthropic_prompt_caching_is_opt_in(monkeypatch):
+    from bench.providers import PROMPT_CACHING_ENV, Prompt
+
+    monkeypatch.delenv(PROMPT_CACHING_ENV, raising=False)
+    context = "[file: SKILL.md]\n---\nname: x\n---\nbody"
+    task = "Goal: Rewrite\n\nInput:\nhello"
+    prompt = Prompt(f"{context}\n\n---\n{task}", context_end=len(context), task_start=len(context) + 6)
+
+    default = AnthropicProvider("claude-test")._request_kwargs(prompt)
+    assert "system" not in default
+    assert default["messages"] == [{"role": "user", "content": str(prompt)}]
+
+    kwargs = AnthropicProvider("claude-test", prompt_caching=True)._request_kwargs(prompt)
+    assert kwargs["system"][0]["text"] == context
+    assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert kwargs["messages"] == [{"role": "user", "content": task}]
+
+    monkeypatch.setenv(PROMPT_CACHING_ENV, "1")
+    assert "system" in AnthropicProvider("claude-test")._request_kwargs(prompt)
+    assert "system" not in AnthropicProvider("claude-test")._request_kwargs(task)
+
+
+def test_provider_factory_uses_registry(monkeypatch):
+    import pytest
+
+    from bench import providers
+    from bench.providers import BaseProvider, ProviderFactory, ProviderResult, register
+
+    monkeypatch.setattr(providers, "_REGISTRY", dict(providers._REGISTRY))
+
+    @register("echo-test")
+    class EchoProvider(BaseProvider):
+        def infer(self, prompt):
+            return ProviderResult(output=prompt, tokens_in=1, tokens_out=1, latency_ms=0.0)
+
+    assert isinstance(ProviderFactory.create("Mock", "m"), MockProvider)
+    assert ProviderFactory.create("ECHO-TEST", "m").infer("hi").output == "hi"
+    with pytest.raises(ValueError, match="Unknown provider 'nope'"):
+        ProviderFactory.create("nope", "m")
@@ -0,0 +1,140 @@
+import numpy as np
+
+from bench.regression import (
+    RegressionThresholds,
+    bootstrap_delta_ci,
+    build_regression_report,
+    cohens_d,
+    permutation_test_p_value,
+)
+
+
+def test_bootstrap_delta_ci_is_seeded_and_brackets_delta():
+    baseline = [10.0, 11.0, 9.5, 10.5, 10.2]
+    candidate = [14.0, 15.5, 13.8, 14.9, 15.1]
+
+    first = bootstrap_delta_ci(
+        baseline, candidate, confidence=0.95, samples=400, rng=np.random.default_rng(17)
+    )
+    second = bootstrap_delta_ci(
+        baseline, candidate, confidence=0.95, samples=400, rng=np.random.default_rng(17)
+    )
+
+    assert first == second
+    assert first[0] <= np.mean(candidate) - np.mean(baseline) <= first[1]
+
+
+def test_permutation_p_value_separates_shifted_samples():
+    baseline = [10.0, 11.0, 9.5, 10.5, 10.2, 9.9]
+    shifted = [14.0, 15.5, 13.8, 14.9, 15.1, 14.4]
+
+    p_shifted = permutation_test_p_value(baseline, shifted, samples=400, rng=np.random.default_rng(3))
+    p_same = permutation_test_p_value(baseline, baseline, samples=400, rng=np.random.default_rng(3))
+
+    assert p_shifted < 0.05
+    assert p_same == 1.0
+
+
+def test_cohens_d_matches_pooled_formula_and_handles_single_observation():
+    a = [4.0, 5.0, 6.0]
+    b = [1.0, 2.0, 3.0]
+
+    assert cohens_d(a, b) == 3.0
+    # One baseline observation adds no variance but still counts toward the pool.
+    assert cohens_d([2.0], [1.0, 2.0, 3.0]) == 0.0
+    assert round(cohens_d([5.0], [1.0, 2.0, 3.0]), 6) == 3.0
+    assert cohens_d([1.0], [2.0]) == 0.0
+
+
+def test_build_regression_report_is_identical_with_worker_threads():
+    rows = []
+    for task in ("t1", "t2", "t3"):
+        for mode, shift in (("baseline", 0.0), ("naive", 40.0)):
+            for i in range(6):
+                rows.append(
+                    {
+                        "task_id": task,
+                        "model": "m",
+                        "judge": "rule",
+                        "mode": mode,
+                        "latency_ms": 100.0 + shift + i,
+                        "rule_score": 0.8 + 0.01 * i,
+                        "cost_usd": 0.01,
+                    }
+                )
+    thresholds = RegressionThresholds()
+
+    serial = build_regression_report(rows, thresholds)
+    threaded = build_regression_report(rows, thresholds, max_workers=4)
+
+    assert serial["comparisons"] == threaded["comparisons"]
+    assert serial["comparison_count"] == 9
+
+
+def test_permutation_early_stop_matches_full_run_unless_it_stops():
+    baseline = [10.0, 11.0, 9.5, 10.5]
+    candidate = [10.4, 10.9, 9.8, 10.6]
+
+    full = permutation_test_p_value(baseline, candidate, samples=64, rng=np.random.default_rng(9))
+    blocked = permutation_test_p_value(
+        baseline, candidate, samples=64, rng=np.random.default_rng(9), early_stop_alpha=0.5
+    )
+    early = permutation_test_p_value(
+        baseline,
+        [20.0, 21.0, 19.5, 20.5],
+        samples=4000,
+        rng=np.random.default_rng(9),
+        early_stop_alpha=0.1,
+    )
+
+    assert blocked == full
+    assert early < 0.1
+
+
+def test_screening_skips_stats_only_for_comparisons_below_threshold():
+    rows = [
+        {"task_id": "t1", "model": "m", "judge": "rule", "mode": mode, "latency_ms": latency, "rule_score": 0.9}
+        for mode, base in (("baseline", 100.0), ("naive", 500.0), ("progressive", 101.0))
+        for latency in (base, base + 2.0, base + 4.0, base + 1.0)
+    ]
+
+    report = build_regression_report(rows, RegressionThresholds(screen_clear_passes=True))
+    by_key = {(c["candidate_mode"], c["metric"]): c for c in report["comparisons"]}
+
+    assert by_key[("naive", "latency_ms")]["screened"] is False
+    assert by_key[("naive", "latency_ms")]["regression"] is True
+    assert by_key[("progressive", "latency_ms")]["screened"] is True
+    assert by_key[("progressive", "latency_ms")]["p_value"] is None
+    assert by_key[("naive", "rule_score")]["screened"] is True
+
+
+def test_permutation_p_value_counts_exact_ties():
+    from fractions import Fraction
+    from itertools import combinations
+
+    cases = [
+        ([0.66] * 3, [1.917] * 3),
+        ([0.1, 0.2, 0.3], [0.3, 0.2, 0.7]),
+        ([0.7, 0.548, 0.5], [0.977, 0.5, 0.548]),
+    ]
+    for baseline, candidate in cases:
+        merged = baseline + candidate
+        size = len(baseline)
+        splits = [
+            [*chosen, *(i for i in range(len(merged)) if i not in chosen)]
+            for chosen in combinations(range(len(merged)), size)
+        ]
+
+        def exact_delta(order):
+            base = sum(Fraction(merged[i]) for i in order[:size]) / size
+            cand = sum(Fraction(merged[i]) for i in order[size:]) / (len(merged) - size)
+            return abs(cand - base)
+
+        observed = exact_delta(list(range(len(merged))))
+        extreme = sum(exact_delta(order) >= observed for order in splits)
+
+        p_value = permutation_test_p_value(
+            baseline, candidate, samples=len(splits), permutations=np.array(splits, dtype=np.int32)
+        )
+
+        assert p_value == (extreme + 1) / (len(splits) + 1)
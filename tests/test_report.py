@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from bench.report import (
+    aggregate_all,
     aggregate_by_mode,
     aggregate_by_task_mode,
     compute_mode_deltas,
@@ -127,6 +128,8 @@ def test_html_report_empty_state(tmp_path):
     html_text = (Path(tmp_path) / "html" / "index.html").read_text()
     assert "No benchmark results were recorded" in html_text
     assert "skillbench-pd --modes baseline progressive --repetitions 1" in html_text
+    assert not list(Path(tmp_path).glob("*.png"))
+    assert not list((Path(tmp_path) / "html" / "assets").glob("*.png"))
 
 
 def test_html_report_warns_when_baseline_missing(tmp_path):
@@ -141,3 +144,135 @@ def test_html_report_includes_accessibility_navigation(tmp_path):
     assert "Skip to content" in html_text
     assert "aria-label=\"Report sections\"" in html_text
     assert "info-chip" in html_text
+
+
+def test_aggregates_skip_missing_metrics_and_keep_mode_order():
+    rows = [
+        {"task_id": "t1", "mode": "progressive", "latency_ms": 10.0, "rule_score": 1.0, "llm_score": 4},
+        {"task_id": "t1", "mode": "baseline", "latency_ms": 30.0},
+        {"task_id": "t2", "mode": "baseline", "latency_ms": 20.0, "rule_score": 0.5, "tokens_in": 7},
+        {"mode": "baseline", "latency_ms": 40.0, "rule_score": 0.5},
+    ]
+
+    aggregates = aggregate_by_mode(rows)
+    task_aggregates = aggregate_by_task_mode(rows)
+
+    assert list(aggregates) == ["progressive", "baseline"]
+    assert aggregates["baseline"]["rule_score"] == 0.3333
+    assert aggregates["baseline"]["tokens_in"] == 7.0
+    assert "llm_score" not in aggregates["baseline"]
+    assert aggregates["baseline"]["latency_p50"] == 30.0
+    assert set(task_aggregates) == {"t1", "t2"}
+    assert "rule_score" not in task_aggregates["t1"]["baseline"]
+    assert aggregate_all(rows) == (aggregates, task_aggregates)
+
+
+def test_task_charts_render_in_process_pool(tmp_path, monkeypatch):
+    from bench import report
+
+    monkeypatch.setattr(report, "PARALLEL_CHART_MIN_TASKS", 2)
+    rows = [
+        {"task_id": f"t{index}", "mode": mode, "latency_ms": float(index + offset)}
+        for index in range(3)
+        for offset, mode in enumerate(("baseline", "progressive"))
+    ]
+
+    chart_paths = report.create_task_charts(rows, tmp_path, max_workers=2)
+
+    assert list(chart_paths) == ["t0_latency", "t1_latency", "t2_latency"]
+    assert all(path.exists() and path.stat().st_size > 0 for path in chart_paths.values())
+
+
+def test_task_charts_fall_back_to_serial_without_process_pool(tmp_path, monkeypatch):
+    from bench import report
+
+    def unavailable(*args, **kwargs):
+        raise OSError("no process support")
+
+    monkeypatch.setattr(report, "PARALLEL_CHART_MIN_TASKS", 2)
+    monkeypatch.setattr(report, "ProcessPoolExecutor", unavailable)
+    rows = [{"task_id": f"t{index}", "mode": "baseline", "latency_ms": float(index)} for index in range(3)]
+
+    chart_paths = report.create_task_charts(rows, tmp_path, max_workers=2)
+
+    assert all(path.exists() and path.stat().st_size > 0 for path in chart_paths.values())
+
+
+def test_latency_percentiles_use_linear_interpolation():
+    latencies = [10.0, 20.0, 30.0, 40.0, 100.0]
+    rows = [{"task_id": "t1", "mode": "baseline", "latency_ms": value} for value in latencies]
+
+    metrics = aggregate_by_mode(rows)["baseline"]
+
+    # rank = (n - 1) * q: p50 lands on 30.0, p95 is 40 + 0.8 * (100 - 40).
+    assert metrics["latency_p50"] == 30.0
+    assert metrics["latency_p95"] == 88.0
+    assert aggregate_by_task_mode(rows)["t1"]["baseline"]["latency_p95"] == 88.0
+
+
+def test_chart_dpi_sets_png_size(tmp_path):
+    import struct
+
+    generate_reports(sample_results(), tmp_path, chart_dpi=50)
+
+    header = (tmp_path / "chart_latency.png").read_bytes()[16:24]
+    # 4x3 inch figures: the IHDR chunk stores width and height in pixels.
+    assert struct.unpack(">II", header) == (200, 150)
+
+
+def test_sanitize_name_collapses_unsafe_runs():
+    from bench.report import _sanitize_name
+
+    assert _sanitize_name("t1_rewrite_brand") == "t1_rewrite_brand"
+    assert _sanitize_name("tasks/t2 format: policy") == "tasks-t2-format-policy"
+    assert _sanitize_name("résumé") == "résumé"
+    assert _sanitize_name("///") == "task"
+
+
+def test_grouped_linear_quantile_matches_numpy_percentile():
+    import numpy as np
+
+    from bench.report import _linear_quantile
+
+    rng = np.random.default_rng(7)
+    groups = [np.sort(rng.random(size) * 1000) for size in (1, 2, 5, 20, 37)]
+    flat = np.concatenate(groups)
+    counts = np.array([len(group) for group in groups])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    for q in (0.5, 0.95):
+        expected = [np.percentile(group, q * 100) for group in groups]
+        assert _linear_quantile(flat, starts, counts, q).tolist() == expected
+
+
+def test_means_round_like_exact_statistics_mean():
+    import random
+    from statistics import mean
+
+    rows = [
+        {"task_id": "t1", "mode": "baseline", "latency_ms": 1.0, "rule_score": value}
+        for value in (0.7, 0.548, 0.5, 0.977)
+    ]
+    assert aggregate_by_mode(rows)["baseline"]["rule_score"] == 0.6813
+
+    rng = random.Random(5)
+    for _ in range(200):
+        values = [round(rng.random(), 3) for _ in range(rng.randint(1, 9))]
+        rows = [{"task_id": "t1", "mode": "baseline", "rule_score": value} for value in values]
+        assert aggregate_by_mode(rows)["baseline"]["rule_score"] == round(mean(values), 4)
+
+
+def test_aggregates_csv_keeps_int_means_of_int_inputs(tmp_path):
+    rows = [
+        {"task_id": "t1", "mode": "baseline", "latency_ms": 100.0, "rule_score": 1, "tokens_in": 40, "tokens_out": 10},
+        {"task_id": "t1", "mode": "baseline", "latency_ms": 120.0, "rule_score": 0.5, "tokens_in": 44, "tokens_out": 11},
+        {"task_id": "t1", "mode": "progressive", "latency_ms": 80.0, "rule_score": 1, "tokens_in": 30, "tokens_out": 12},
+        {"task_id": "t1", "mode": "progressive", "latency_ms": 90.0, "rule_score": 1, "tokens_in": 31, "tokens_out": 12},
+    ]
+    artifacts = generate_reports(rows, tmp_path)
+
+    assert Path(artifacts["aggregates_csv"]).read_text() == (
+        "mode,latency_ms,latency_p50,latency_p95,rule_score,tokens_in,tokens_out\n"
+        "baseline,110.0,110.0,119.0,0.75,42,10.5\n"
+        "progressive,85.0,85.0,89.5,1,30.5,12\n"
+    )
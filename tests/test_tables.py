@@ -0,0 +1,20 @@
+from bench.tables import render_github_table
+
+
+def test_render_github_table_aligns_numeric_columns_and_keeps_formatting():
+    table = render_github_table(
+        ["mode", "delta"],
+        [["naive", "+0.100"], ["progressive", "-12.500"], ["baseline", ""]],
+    )
+
+    assert table.splitlines() == [
+        "| mode        |   delta |",
+        "|-------------|---------|",
+        "| naive       |  +0.100 |",
+        "| progressive | -12.500 |",
+        "| baseline    |         |",
+    ]
+
+
+def test_render_github_table_without_rows():
+    assert render_github_table(["mode"], []) == "| mode |\n|------|"